@@ -1,7 +1,9 @@
 """Constants used across the application."""
+from functools import lru_cache
+from types import MappingProxyType
 
 # Color definitions
-COLORS = {
+_COLORS = {
     'RED': '#FF5252',          # For errors/missing data/no OCR
     'LIGHT_RED': '#FFCDD2',    # For rows missing vendor information
     'YELLOW': "#FFF89D",       # For incomplete cells
@@ -9,4 +11,14 @@ COLORS = {
     'LIGHT_BLUE': '#81D4FA',   # For special terms values
     'LIGHT_GREY': '#F5F5F5',   # For non-editable cells
     'WHITE': '#FFFFFF'         # For complete rows
-}
\ No newline at end of file
+}
+
+# Read-only view so no caller can mutate the shared palette
+COLORS = MappingProxyType(_COLORS)
+
+
+@lru_cache(maxsize=None)
+def qcolor(name):
+    """Return a cached QColor for a COLORS entry (parsed once per process)."""
+    from PyQt5.QtGui import QColor
+    return QColor(_COLORS[name])
@@ -1,15 +1,72 @@
 """File handling controller for invoice processing."""
+import logging
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from PyQt5.QtWidgets import QApplication, QMessageBox, QProgressDialog
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog
+from PyQt5.QtCore import Qt, QEventLoop, QObject, pyqtSignal
 from pdf_reader import extract_text_data_from_pdfs
 from extractor import extract_fields
-from logging_config import get_logger
+from logging_config import get_logger, worker_process_context, get_worker_log_queue, init_worker_logging
 
 logger = get_logger(__name__)
 
+# Files handed to one extraction call (amortizes per-call setup)
+EXTRACT_CHUNK_SIZE = 8
+
+
+def _extract_batch(paths):
+    """Extract fields from a list of PDFs (top-level so worker processes can pickle it).
+
+    Returns ``(data, path, error)`` per file, with ``error`` None on success, so
+    one bad file never costs the rest of its batch.
+    """
+    documents = extract_text_data_from_pdfs(paths)
+    try:
+        extracted = extract_fields(documents)
+    except Exception:
+        # Redo the batch one file at a time to find the file that failed
+        return [_extract_one(doc, path) for doc, path in zip(documents, paths)]
+    return [
+        (extracted[i] if i < len(extracted) else [], path, None)
+        for i, path in enumerate(paths)
+    ]
+
+
+def _extract_one(document, path):
+    """Extract fields from a single already-read document, capturing any error."""
+    try:
+        extracted = extract_fields([document])
+    except Exception as e:
+        return [], path, str(e)
+    return (extracted[0] if extracted else []), path, None
+
+
+def _chunk(items, size):
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class ExtractSignals(QObject):
+    """Carries finished chunks from executor callback threads to the GUI thread."""
+    done = pyqtSignal(int, object)   # (index of first file in chunk, [(data, path, error), ...])
+
+
+def _forward_chunk(signals, first_index, chunk, future):
+    """Future done-callback: emit the chunk's per-file results."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None:
+        batch = future.result()
+    else:
+        # The worker itself died (e.g. a broken pool) - every file in the chunk failed
+        batch = [([], path, str(error)) for path in chunk]
+    signals.done.emit(first_index, batch)
+
+
 class FileController:
     """Controller for file operations."""
     
@@ -31,31 +88,85 @@ class FileController:
         progress.setMinimumDuration(0)
         progress.show()
 
-        results = []
-        for i, file in enumerate(new_files, 1):
-            if progress.wasCanceled():
-                break
-
-            text_blocks = extract_text_data_from_pdfs([file])
-            extracted = extract_fields(text_blocks)
-            data = extracted[0] if extracted else []
-            results.append((data, file))
-            self.loaded_files.add(os.path.normpath(file))
-
-            progress.setValue(i)
-            QApplication.processEvents()
+        completed = {}
+        if len(new_files) == 1:
+            # Spinning up a worker process is not worth it for a single file
+            self._collect(0, _extract_batch(new_files), completed)
+        else:
+            max_workers = min(len(new_files), os.cpu_count() or 1)
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=worker_process_context(),
+                initializer=init_worker_logging,
+                initargs=(get_worker_log_queue(), logging.getLogger().getEffectiveLevel()),
+            )
+            try:
+                self._run_workers(new_files, progress, executor, max_workers, completed)
+            finally:
+                executor.shutdown(wait=not progress.wasCanceled(), cancel_futures=True)
 
         progress.close()
+        results = [completed[idx] for idx in sorted(completed)]
+        # Single bulk update once every chunk has been collected
+        self._add_files(file for _, file in results)
         return results
-        
+
+    def _run_workers(self, new_files, progress, executor, max_workers, completed):
+        """Submit chunks to the process pool and wait on a local event loop.
+
+        Done-callbacks fire on executor threads, so results reach the GUI thread
+        through a queued signal.
+        """
+        # Keep every worker busy on small batches, up to EXTRACT_CHUNK_SIZE files per task
+        chunk_size = max(1, min(EXTRACT_CHUNK_SIZE, -(-len(new_files) // max_workers)))
+        chunks = _chunk(new_files, chunk_size)
+
+        state = {"pending": len(chunks), "processed": 0, "canceled": False}
+        loop = QEventLoop()
+        signals = ExtractSignals()
+
+        def on_done(start, batch):
+            if state["canceled"]:
+                return
+            self._collect(start, batch, completed)
+            state["processed"] += len(batch)
+            progress.setValue(state["processed"])
+            state["pending"] -= 1
+            if state["pending"] == 0:
+                loop.quit()
+
+        def on_canceled():
+            state["canceled"] = True
+            loop.quit()
+
+        # Queued even when a future is already done at add_done_callback time,
+        # so no result is handled before loop.exec_() starts
+        signals.done.connect(on_done, Qt.QueuedConnection)
+        progress.canceled.connect(on_canceled)
+        for i, chunk in enumerate(chunks):
+            future = executor.submit(_extract_batch, chunk)
+            future.add_done_callback(partial(_forward_chunk, signals, i * chunk_size, chunk))
+
+        loop.exec_()
+        progress.canceled.disconnect(on_canceled)
+
+    @staticmethod
+    def _collect(start, batch, completed):
+        """Store successful results by input index and log each failed file."""
+        for idx, (data, path, error) in enumerate(batch, start):
+            if error is None:
+                completed[idx] = (data, path)
+            else:
+                logger.error("Extraction failed for %s: %s", path, error)
+
     def filter_new_files(self, files):
         """Filter out already processed files."""
-        new_files = []
-        for file in files:
-            norm_path = os.path.normpath(file)
-            if norm_path not in self.loaded_files:
-                new_files.append(file)
-        return new_files
+        # loaded_files only ever holds normalized paths, so membership is a direct lookup
+        return [f for f in files if os.path.normpath(f) not in self.loaded_files]
+
+    def _add_files(self, file_paths):
+        """Record files as loaded, keeping the normalized-path invariant."""
+        self.loaded_files.update(map(os.path.normpath, file_paths))
     
     def open_file(self, file_path):
         """Open a file with the system's default application."""
@@ -71,9 +182,9 @@ class FileController:
             if os.name == 'nt':
                 os.startfile(file_path)
             elif os.name == 'posix':
-                subprocess.call(('open', file_path))
+                self._launch(['open', file_path])
             else:
-                subprocess.call(('xdg-open', file_path))
+                self._launch(['xdg-open', file_path])
             return True
         except Exception as e:
             QMessageBox.critical(
@@ -83,6 +194,17 @@ class FileController:
             )
             return False
     
+    @staticmethod
+    def _launch(args):
+        """Start an opener without waiting for it to exit."""
+        subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
+
     def remove_file(self, file_path):
         """Remove a file from the loaded files list."""
         if not file_path:
@@ -92,6 +214,14 @@ class FileController:
             self.loaded_files.remove(norm)
             return True
         return False
+
+    def rename_file(self, old_path, new_path):
+        """Track a loaded file under its new path after it was renamed on disk."""
+        old_norm = os.path.normpath(old_path)
+        new_norm = os.path.normpath(new_path)
+        if old_norm in self.loaded_files:
+            self.loaded_files.remove(old_norm)
+            self.loaded_files.add(new_norm)
     
     def clear_all_files(self):
         """Clear all loaded files."""
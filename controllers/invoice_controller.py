@@ -1,61 +1,109 @@
 """Controller for invoice data operations."""
+import os
 import re
 from datetime import datetime
 import csv
+from functools import lru_cache
 
 from PyQt5.QtWidgets import QMessageBox, QTableWidgetItem
 from utils import get_vendor_csv_path
+from extractors.utils import calculate_discount_due_date
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+
+def _clean(value):
+    """Collapse internal whitespace and trim the ends of a cell value."""
+    # str.split()/join beats re.sub(r"\s+", " ", s).strip() on every cell
+    # shape seen here, and both treat the same characters as whitespace
+    return ' '.join((value or '').split())
+
+
+class _VendorDialect(csv.excel):
+    """vendors.csv dialect - tolerates a space after each comma (incl. before quotes)."""
+    skipinitialspace = True
+
+
+@lru_cache(maxsize=2048)
+def _format_date(date_str):
+    """Format a date string as MM/DD/YY (memoized - exports repeat the same dates)."""
+    if not date_str:
+        return ""
+    
+    # Already in MM/DD/YY format - a '/' value can never parse as %Y-%m-%d anyway
+    if "/" in date_str:
+        return date_str
+    
+    # If not in correct format, try to convert
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%m/%d/%y")
+    except ValueError:
+        return date_str  # Return as-is if parsing fails
+
+
 class InvoiceController:
     """Controller for invoice data operations."""
     
     def __init__(self, main_window):
         """Initialize with reference to main window."""
         self.main_window = main_window
+        # ((path, mtime_ns), mapping) for the last parsed vendors.csv
+        self._vendor_cache = None
+        # file path -> (vendor, terms, invoice date, due date) after the last recalculation
+        self._last_calc = {}
     
     def recalculate_dependent_fields(self, row):
         """Recalculate fields that depend on other fields."""
+        table = self.main_window.table
         # First, recalculate the due date from discount terms
-        vendor_name = self.main_window.table.get_cell_text(row, 1).strip()
-        discount_terms = self.main_window.table.get_cell_text(row, 5).strip()
-        invoice_date = self.main_window.table.get_cell_text(row, 4).strip()
+        vendor_name = table.get_cell_text(row, 1).strip()
+        discount_terms = table.get_cell_text(row, 5).strip()
+        invoice_date = table.get_cell_text(row, 4).strip()
 
         # Always force recalculation of due date if there are terms and invoice date
         if discount_terms and invoice_date:
-            from extractors.utils import calculate_discount_due_date
+            # Skip when nothing feeding the calculation (or its output) changed since last time.
+            # Keyed by file path because view rows shift with sorting/filtering.
+            file_path = table.get_file_path_for_row(row)
+            current_due = table.get_cell_text(row, 6).strip()
+            inputs = (vendor_name, discount_terms, invoice_date)
+            if (file_path and self._last_calc.get(file_path) == inputs + (current_due,)
+                    and not table.is_cell_edited(row, 6)):
+                return
+
             try:
                 due_date = calculate_discount_due_date(discount_terms, invoice_date, vendor_name)
                 if due_date:
                     # FORCE UPDATE: Always update the due date regardless of any tracking state
-                    self.main_window.table.update_calculated_field(row, 6, due_date, True)
+                    table.update_calculated_field(row, 6, due_date, True)
+                    current_due = due_date
                     
                     # CRITICAL: Ensure due date is REMOVED from manually_edited
                     key = (row, 6)
-                    if key in self.main_window.table.manually_edited:
-                        self.main_window.table.manually_edited.remove(key)
+                    if key in table.manually_edited:
+                        table.manually_edited.remove(key)
             except Exception as e:
                 logger.warning(f"Could not compute due date: {e}")
+            if file_path:
+                self._last_calc[file_path] = inputs + (current_due,)
+
+    def forget_file(self, file_path):
+        """Drop the cached due-date calculation for a file removed from the table."""
+        self._last_calc.pop(file_path, None)
+
+    def rename_file(self, old_path, new_path):
+        """Keep a renamed file's cached due-date calculation under its new path."""
+        if old_path in self._last_calc:
+            self._last_calc[new_path] = self._last_calc.pop(old_path)
+
+    def clear_calculations(self):
+        """Drop every cached due-date calculation (table cleared or replaced)."""
+        self._last_calc.clear()
     
     def format_date(self, date_str):
         """Format date for accounting system."""
-        if not date_str:
-            return ""
-        
-        try:
-            # Try to parse the date
-            if "/" in date_str:
-                parts = date_str.split("/")
-                if len(parts) == 3:
-                    return date_str  # Already in MM/DD/YY format
-            
-            # If not in correct format, try to convert
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.strftime("%m/%d/%y")
-        except:
-            return date_str  # Return as-is if parsing fails
+        return _format_date(date_str or "")
 
     def load_vendor_mapping(self):
         """Load vendor numbers from vendors.csv."""
@@ -63,12 +111,15 @@ class InvoiceController:
         
         try:
             vendors_csv_path = get_vendor_csv_path()
+            cache_key = (vendors_csv_path, os.stat(vendors_csv_path).st_mtime_ns)
+            if self._vendor_cache and self._vendor_cache[0] == cache_key:
+                return self._vendor_cache[1]
             
             logger.debug(f"Looking for vendors file at: {vendors_csv_path}")
             
-            with open(vendors_csv_path, 'r', encoding='utf-8') as file:
+            with open(vendors_csv_path, 'r', encoding='utf-8', newline='', buffering=65536) as file:
                 # Use regular CSV reader instead of DictReader
-                reader = csv.reader(file)
+                reader = csv.reader(file, dialect=_VendorDialect)
                 for row in reader:
                     if len(row) >= 2:
                         # First column is vendor number, second is vendor name
@@ -77,6 +128,7 @@ class InvoiceController:
                         if vendor_number and vendor_name:
                             vendor_mapping[vendor_name] = vendor_number
                     
+            self._vendor_cache = (cache_key, vendor_mapping)
             logger.info(f"Loaded {len(vendor_mapping)} vendors from vendors.csv")
         except Exception as e:
             logger.error(f"Failed to load vendor mapping: {e}")
@@ -87,64 +139,64 @@ class InvoiceController:
         """Prepare data for export to CSV."""
         table = self.main_window.table
         vendor_mapping = self.load_vendor_mapping()
+        # Fallback lookup tolerant of case and spacing differences in vendor names
+        norm_map = {_clean(k).casefold(): v for k, v in vendor_mapping.items()}
+        _get = vendor_mapping.get
+        _norm_get = norm_map.get
+        _fmt = self.format_date
         rows_to_export = []
         
         # Use the underlying model so filtered-out rows are also exported
         model = getattr(table, "_model", None)
-        total_rows = model.rowCount() if model else table.rowCount()
-
-        logger.info(f"Preparing export data from {total_rows} rows")
-
-        for src_row in range(total_rows):
-            if model:
-                vals = model.row_values(src_row)
-                raw_vendor_name = vals[0]
-                invoice_number = ' '.join((vals[1] or '').strip().split())
-                po_number = ' '.join((vals[2] or '').strip().split())
-                invoice_date = ' '.join((vals[3] or '').strip().split())
-                discount_terms = ' '.join((vals[4] or '').strip().split())
-                due_date = ' '.join((vals[5] or '').strip().split())
-                total_amount = ' '.join((vals[6] or '').strip().split())
-                shipping_cost = ' '.join((vals[7] or '').strip().split())
-            else:
-                # Fallback to view-access methods
-                raw_vendor_name = table.get_cell_text(src_row, 1)
-                invoice_number = ' '.join(table.get_cell_text(src_row, 2).strip().split())
-                po_number = ' '.join(table.get_cell_text(src_row, 3).strip().split())
-                invoice_date = ' '.join(table.get_cell_text(src_row, 4).strip().split())
-                discount_terms = ' '.join(table.get_cell_text(src_row, 5).strip().split())
-                due_date = ' '.join(table.get_cell_text(src_row, 6).strip().split())
-                total_amount = ' '.join(table.get_cell_text(src_row, 7).strip().split())
-                shipping_cost = ' '.join(table.get_cell_text(src_row, 8).strip().split())
-
-            vendor_name = ' '.join((raw_vendor_name or '').strip().split())
+        if model:
+            rows = model.all_row_values()
+        else:
+            # Fallback to view-access methods
+            rows = [
+                [table.get_cell_text(src_row, col) for col in range(1, 9)]
+                for src_row in range(table.rowCount())
+            ]
+
+        logger.info(f"Preparing export data from {len(rows)} rows")
+
+        for src_row, vals in enumerate(rows):
+            # Clean the required fields first so incomplete rows are skipped cheaply
+            vendor_name = _clean(vals[0])
+            invoice_number = _clean(vals[1])
+            invoice_date = _clean(vals[3])
+            total_amount = _clean(vals[6])
             
             # Skip incomplete rows
             if not vendor_name or not invoice_number or not invoice_date or not total_amount:
-                logger.warning(f"Skipping incomplete row {src_row+1}")
+                logger.warning("Skipping incomplete row %d", src_row + 1)
                 continue
+
+            po_number = _clean(vals[2])
+            discount_terms = _clean(vals[4])
+            due_date = _clean(vals[5])
+            shipping_cost = _clean(vals[7])
         
             # Look up vendor number
-            logger.debug(f"Looking up vendor in mapping: '{vendor_name}'")
-            vendor_number = vendor_mapping.get(vendor_name, "0")  # Default to "0" if not found
+            logger.debug("Looking up vendor in mapping: %r", vendor_name)
+            vendor_number = _get(vendor_name) or _norm_get(vendor_name.casefold(), "0")  # Default to "0" if not found
             if not vendor_number or vendor_number == "0":
-                logger.warning(f"No vendor number found for: '{vendor_name}'")
+                logger.warning("No vendor number found for: %r", vendor_name)
         
             # Create complete data dictionary with all needed information
             invoice_data = {
                 "vendor_number": vendor_number,
                 "invoice_number": invoice_number,
                 "po_number": po_number,
-                "invoice_date": self.format_date(invoice_date),
+                "invoice_date": _fmt(invoice_date),
                 "discount_terms": discount_terms,
-                "due_date": self.format_date(due_date),
+                "due_date": _fmt(due_date),
                 "total_amount": total_amount,
                 "shipping_cost": shipping_cost,
                 "vendor_name": vendor_name,
             }
             
             rows_to_export.append(invoice_data)
-            logger.debug(f"Prepared row {src_row} for export: {vendor_name} ({vendor_number})")
+            logger.debug("Prepared row %d for export: %s (%s)", src_row, vendor_name, vendor_number)
     
         logger.info(f"Export data preparation complete: {len(rows_to_export)} rows")
         return rows_to_export
@@ -1,3 +1,5 @@
+import sys
+
 from extractors import (
     extract_invoice_number,
     extract_invoice_date,
@@ -8,11 +10,85 @@ from extractors import (
     extract_shipping_cost,
     extract_quantity
 )
+from extractors.common_extraction import joined_text, joined_text_upper
 from extractors.utils import calculate_discount_due_date, calculate_discounted_total, check_negative_total
-from logging_config import get_logger, set_performance_mode, restore_normal_mode
+from logging_config import (
+    get_logger, set_performance_mode, restore_normal_mode, start_async_logging, stop_async_logging
+)
 
 logger = get_logger(__name__)
 
+# Special discount terms where due date should equal invoice date
+SPECIAL_TERMS = frozenset({
+    "STATEMENT", "CREDIT MEMO", "CREDIT NOTE", "WARRANTY",
+    "RETURN AUTHORIZATION", "DEFECTIVE", "NO TERMS",
+    "PRODUCT RETURN", "PARTS MISSING", "DUE TODAY", "RA FOR CREDIT"
+})
+
+def _extract_document(doc):
+    """Extract the output row for a single document."""
+    words = doc["words"]
+    # Join the document text once and share it with the extractors that scan it
+    text_blob = joined_text(words)
+    text_upper = joined_text_upper(words)
+
+    vendor_name = extract_vendor_name(words)
+    logger.debug("Extracted vendor: '%s'", vendor_name)
+
+    # Discount terms are extracted first: quantity and shipping cost check
+    # them for credit documents, and reuse this result instead of rescanning
+    discount_terms = extract_discount_terms(words, vendor_name, text_upper)
+
+    # Extract enhanced total amount data
+    total_amount_data = extract_total_amount(words, vendor_name)
+
+    # Extract quantity with metadata
+    quantity_result = extract_quantity(words, vendor_name, discount_terms)
+    if isinstance(quantity_result, tuple):
+        quantity_value, quantity_metadata = quantity_result
+    else:
+        # Fallback for backward compatibility (shouldn't happen with new code)
+        quantity_value = quantity_result
+        quantity_metadata = {}
+
+    invoice_number = extract_invoice_number(words, vendor_name)
+    po_number = extract_po_number(words, vendor_name)
+    invoice_date = extract_invoice_date(words, vendor_name, text_blob)
+    discount_due_date = ""
+    shipping_cost = extract_shipping_cost(words, vendor_name, discount_terms)
+    total_amount = total_amount_data['total_amount']
+
+    if discount_terms and invoice_date:
+        try:
+            # Special discount terms where due date should equal invoice date
+            if discount_terms in SPECIAL_TERMS:
+                # For special terms, due date equals invoice date
+                discount_due_date = invoice_date
+            else:
+                # Normal calculation for regular discount terms
+                discount_due_date = calculate_discount_due_date(
+                    discount_terms, invoice_date, vendor_name
+                )
+        except Exception as e:
+            logger.warning(f"Could not compute discount due date: {e}")
+
+            
+    if total_amount:
+        total_amount = check_negative_total(total_amount, discount_terms)
+
+    # A tuple: rows are read-only downstream, and tuples are smaller to
+    # build and to pickle back from pool workers. Vendor names and terms repeat
+    # across a batch, so every row shares one interned copy of each.
+    return (
+        sys.intern(vendor_name), invoice_number, po_number, invoice_date,
+        sys.intern(discount_terms), discount_due_date,
+        total_amount, shipping_cost,
+        "", "", "", "",  # QC values (Subtotal, Disc%, Disc$, Shipping)
+        "false",  # QC used flag
+        quantity_value
+    )
+
+
 def extract_fields(documents):
     # More informative logging
     if len(documents) == 1:
@@ -25,91 +101,40 @@ def extract_fields(documents):
     if len(documents) > 5:
         set_performance_mode()
 
-    extracted_rows = []
-
-    # Only show progress for larger batches
-    show_progress = len(documents) > 10
-    progress_interval = max(1, len(documents) // 10)  # Show progress every 10%
-
-    for i, doc in enumerate(documents, 1):
-        words = doc["words"]
-        file_name = doc.get("file_name", "Unknown")
-
-        # Reduced logging frequency
-        if show_progress and i % progress_interval == 0:
-            logger.info(f"Processing documents: {i}/{len(documents)}")
-
-        logger.debug(f"Processing document {i}/{len(documents)}: {file_name} ({len(words)} words)")
-
-        vendor_name = extract_vendor_name(words)
-        logger.debug(f"Extracted vendor: '{vendor_name}'")
-
-        # Extract enhanced total amount data
-        total_amount_data = extract_total_amount(words, vendor_name)
-
-        # Extract quantity with metadata
-        quantity_result = extract_quantity(words, vendor_name)
-        if isinstance(quantity_result, tuple):
-            quantity_value, quantity_metadata = quantity_result
-        else:
-            # Fallback for backward compatibility (shouldn't happen with new code)
-            quantity_value = quantity_result
-            quantity_metadata = {}
-
-        row = {
-            "Vendor Name": vendor_name,
-            "Invoice Number": extract_invoice_number(words, vendor_name),
-            "PO Number": extract_po_number(words, vendor_name),
-            "Invoice Date": extract_invoice_date(words, vendor_name),
-            "Discount Terms": extract_discount_terms(words, vendor_name),
-            "Discount Due Date": "",
-            "Shipping Cost": extract_shipping_cost(words, vendor_name),
-            "Total Amount": total_amount_data.get('total_amount', '') if isinstance(total_amount_data, dict) else (str(total_amount_data) if total_amount_data is not None else ''),
-            "Quantity": quantity_value,
-            "_total_amount_enhanced": total_amount_data,  # Store enhanced data for QC
-            "_quantity_metadata": quantity_metadata  # Store quantity extraction metadata
-        }
-
-        if row["Discount Terms"] and row["Invoice Date"]:
-            try:
-                # Special discount terms where due date should equal invoice date
-                special_terms = [
-                    "STATEMENT", "CREDIT MEMO", "CREDIT NOTE", "WARRANTY",
-                    "RETURN AUTHORIZATION", "DEFECTIVE", "NO TERMS",
-                    "PRODUCT RETURN", "PARTS MISSING", "DUE TODAY", "RA FOR CREDIT"
-                ]
-                
-                if row["Discount Terms"] in special_terms:
-                    # For special terms, due date equals invoice date
-                    row["Discount Due Date"] = row["Invoice Date"]
-                else:
-                    # Normal calculation for regular discount terms
-                    discounted_due = calculate_discount_due_date(
-                        row["Discount Terms"], row["Invoice Date"], row["Vendor Name"]
-                    )
-                    row["Discount Due Date"] = discounted_due
-            except Exception as e:
-                logger.warning(f"Could not compute discount due date: {e}")
-
-                
-        if row["Total Amount"]:
-            row["Total Amount"] = check_negative_total(row["Total Amount"], row["Discount Terms"])
-
-        extracted_rows.append([
-            row["Vendor Name"], row["Invoice Number"], row["PO Number"], row["Invoice Date"],
-            row["Discount Terms"], row["Discount Due Date"],
-            row["Total Amount"], row["Shipping Cost"],
-            "", "", "", "",  # QC values (Subtotal, Disc%, Disc$, Shipping)
-            "false",  # QC used flag
-            row["Quantity"]
-        ])
-
-    # Restore normal logging
-    if len(documents) > 5:
-        restore_normal_mode()
+    try:
+        extracted_rows = _extract_all(documents)
+    finally:
+        # Restore normal logging
+        if len(documents) > 5:
+            restore_normal_mode()
 
     if len(extracted_rows) > 10:
         logger.info(f"Field extraction complete: processed {len(extracted_rows)} documents successfully")
     else:
         logger.debug(f"Field extraction complete: processed {len(extracted_rows)} documents successfully")
-    return extracted_rows
\ No newline at end of file
+    return extracted_rows
+
+
+def _extract_all(documents):
+    extracted_rows = [None] * len(documents)
+
+    # Only show progress for larger batches
+    show_progress = len(documents) > 10
+    progress_interval = max(1, len(documents) // 10)  # Show progress every 10%
+
+    # Larger batches hand their log output to a background thread
+    batch_logging = len(documents) > 5
+    if batch_logging:
+        start_async_logging()
+    try:
+        for i, doc in enumerate(documents, 1):
+            # Reduced logging frequency
+            if show_progress and i % progress_interval == 0:
+                logger.info(f"Processing documents: {i}/{len(documents)}")
+
+            logger.debug("Processing document %d/%d: %s (%d words)", i, len(documents), doc.get("file_name", "Unknown"), len(doc["words"]))
+            extracted_rows[i - 1] = _extract_document(doc)
+    finally:
+        if batch_logging:
+            stop_async_logging()
+    return extracted_rows
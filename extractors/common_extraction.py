@@ -1,32 +1,156 @@
 import re
+import string
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import NamedTuple
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Drops ":" and "#" from normalized text in one pass
+_NORM_TABLE = str.maketrans({":": None, "#": None})
+# Drops all ASCII punctuation from custom label text in one pass
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+# Reads a word's text in C, without per-word bytecode
+_word_text = itemgetter("text")
+
+
+class NormalizedWord(NamedTuple):
+    """
+    A single normalized word. Fields are read as attributes in the hot loops
+    below; string-key access (w["text"], w.get("page_num", 0)) is kept for
+    the vendor-specific extractors that still index words like dicts.
+    """
+    index: int
+    text: str
+    orig: str
+    x0: float
+    x1: float
+    top: float
+    bottom: float
+    page_num: int
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            # Only field names act as keys - not tuple methods like count/index
+            if key not in _WORD_FIELDS:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in _WORD_FIELDS else default
+
+
+_WORD_FIELDS = frozenset(NormalizedWord._fields)
+
+
+class NormalizedWords(list):
+    """
+    List of NormalizedWord in reading order, with a lazily built index of
+    positions sorted by top so vertical range queries can bisect.
+    """
+    _by_top = None
+
+    def by_top(self):
+        if self._by_top is None:
+            order = sorted(range(len(self)), key=lambda i: self[i].top)
+            self._by_top = ([self[i].top for i in order], order)
+        return self._by_top
+
+
+def _words_in_band(normalized_words, low, high):
+    """
+    Return the words whose top lies within [low, high], in reading order.
+    Callers pass a band slightly wider than they need and apply their exact
+    distance test afterwards, so float rounding at the edges can't drop words.
+    """
+    if not isinstance(normalized_words, NormalizedWords):
+        return [w for w in normalized_words if low <= w.top <= high]
+    tops, order = normalized_words.by_top()
+    band = order[bisect_left(tops, low):bisect_right(tops, high)]
+    band.sort()
+    return [normalized_words[i] for i in band]
+
+
+def _memoized(validation_func):
+    """
+    Wrap validation_func with a cache keyed on the word text. Neighbouring
+    labels share most of their candidate words, so within one lookup each
+    distinct text only needs validating once.
+    """
+    cache = {}
+
+    def validate(text):
+        try:
+            return cache[text]
+        except KeyError:
+            result = cache[text] = validation_func(text)
+            return result
+
+    return validate
+
+
+# The last words list joined by joined_text and its text, swapped as one tuple
+# so concurrent readers never pair a list with another list's text. Holding
+# the list also keeps its id from being reused while it is cached.
+_joined = (None, "")
+
+
+def joined_text(words):
+    """
+    Return " ".join of the word texts. Every extractor of a document receives
+    the same words list, so the join is cached for the most recent list and
+    the rest reuse it.
+    """
+    global _joined
+    cached_words, text = _joined
+    if cached_words is not words:
+        text = " ".join(map(_word_text, words))
+        _joined = (words, text)
+    return text
+
+
+_joined_upper = (None, "")
+
+
+def joined_text_upper(words):
+    """
+    Return joined_text(words).upper(), cached for the most recent list the
+    same way so the terms lookups of a document upper-case its text once.
+    """
+    global _joined_upper
+    cached_words, text = _joined_upper
+    if cached_words is not words:
+        text = joined_text(words).upper()
+        _joined_upper = (words, text)
+    return text
+
+
 def normalize_words(words, first_page_only=True):
     """
     Normalize words by filtering to first page (optional) and standardizing text format
     """
     if first_page_only:
         filtered_words = [w for w in words if w.get("page_num", 0) == 0]
-        logger.debug(f"Using page_num == 0 to restrict to first page")
-        logger.debug(f"Retained {len(filtered_words)} words for first-page check")
+        logger.debug("Using page_num == 0 to restrict to first page")
+        logger.debug("Retained %d words for first-page check", len(filtered_words))
     else:
         filtered_words = words
         
-    return [
-        {
-            "index": i,
-            "text": w["text"].strip().lower().replace(":", "").replace("#", ""),
-            "orig": w["text"],
-            "x0": w["x0"],
-            "x1": w["x1"],
-            "top": w["top"],
-            "bottom": w["bottom"],
-            "page_num": w.get("page_num", 0)
-        }
+    return NormalizedWords(
+        NormalizedWord(
+            i,
+            w["text"].strip().lower().translate(_NORM_TABLE),
+            w["text"],
+            w["x0"],
+            w["x1"],
+            w["top"],
+            w["bottom"],
+            w.get("page_num", 0),
+        )
         for i, w in enumerate(filtered_words)
-    ]
+    )
 
 def find_label_positions(normalized_words, label_type="invoice", custom_label=None):
     """
@@ -36,8 +160,7 @@ def find_label_positions(normalized_words, label_type="invoice", custom_label=No
     label_positions = []
 
     def normalize_label(text):
-        import string
-        return "".join(c for c in text.lower() if c not in string.punctuation).strip()
+        return text.lower().translate(_PUNCTUATION_TABLE).strip()
 
     if custom_label:
         # Split custom label into words for multi-word matching
@@ -47,8 +170,8 @@ def find_label_positions(normalized_words, label_type="invoice", custom_label=No
             # Single-word label - original behavior
             custom_label_norm = custom_label_words[0]
             for w in normalized_words:
-                if normalize_label(w["orig"]) == custom_label_norm:
-                    label_positions.append((w["x0"], w["x1"], w["top"], w["bottom"]))
+                if normalize_label(w.orig) == custom_label_norm:
+                    label_positions.append((w.x0, w.x1, w.top, w.bottom))
         else:
             # Multi-word label - find consecutive words on same line
             pattern_length = len(custom_label_words)
@@ -59,92 +182,100 @@ def find_label_positions(normalized_words, label_type="invoice", custom_label=No
 
                 for j, pattern_word in enumerate(custom_label_words):
                     word = normalized_words[i + j]
-                    if normalize_label(word["orig"]) != pattern_word:
+                    if normalize_label(word.orig) != pattern_word:
                         matches = False
                         break
                     matched_words.append(word)
 
                 if matches:
                     # Verify all words are on the same line (within 5px Y tolerance)
-                    first_y = matched_words[0]["top"]
-                    if all(abs(w["top"] - first_y) < 5 for w in matched_words):
+                    first_y = matched_words[0].top
+                    if all(abs(w.top - first_y) < 5 for w in matched_words):
                         # Found matching pattern - return combined x-range
-                        combined_x0 = matched_words[0]["x0"]
-                        combined_x1 = matched_words[-1]["x1"]
+                        combined_x0 = matched_words[0].x0
+                        combined_x1 = matched_words[-1].x1
                         combined_y = first_y
-                        combined_bottom = matched_words[0].get("bottom", first_y)
+                        combined_bottom = matched_words[0].bottom
                         label_positions.append((combined_x0, combined_x1, combined_y, combined_bottom))
 
         return label_positions
 
-    # Two-word labels (e.g., "invoice #", "po number")
-    for i in range(len(normalized_words) - 1):
-        first = normalized_words[i]
-        second = normalized_words[i + 1]
-        if first["text"] == label_type and second["text"] in ["#", "no", "number"]:
-            label_positions.append((first["x0"], second["x1"], second["top"]))
-    
-    # Single-word labels
-    if label_type == "invoice":
-        for idx, w in enumerate(normalized_words):
-            if w["text"] == "invoice":
-                # Skip if "original" is directly before "invoice"
-                if idx > 0 and normalized_words[idx - 1]["text"] == "original":
-                    continue
-                # Skip if "date" or "date:" is directly after "invoice" and "invoice" is not "invoice:"
-                if (
-                    idx < len(normalized_words) - 1 and
-                    normalized_words[idx + 1]["text"] in ["date", "date:"] and
-                    w["orig"].strip().lower() not in ["invoice:", "invoice:"]
-                ):
-                    continue
-                label_positions.append((w["x0"], w["x1"], w["top"]))
-    
-    # For PO labels, include "purchase order" as two-word label
-    if label_type == "po":
-        for i in range(len(normalized_words) - 1):
-            first = normalized_words[i]
-            second = normalized_words[i + 1]
-            if first["text"] == "purchase" and second["text"] == "order":
-                label_positions.append((first["x0"], second["x1"], first["top"]))
-        
-        # Single-word PO labels
-        for idx, w in enumerate(normalized_words):
-            if w["text"] == "po":
-                label_positions.append((w["x0"], w["x1"], w["top"]))
-    
+    # One pass over the words, checking each word against the one before it.
+    # Matches are kept per label kind and concatenated in the original
+    # priority order: two-word labels, "purchase order", then single words.
+    two_word_labels = []
+    purchase_order_labels = []
+    single_word_labels = []
+    last_idx = len(normalized_words) - 1
+    prev = None
+
+    for idx, w in enumerate(normalized_words):
+        text = w.text
+
+        if prev is not None:
+            # Two-word labels (e.g., "invoice #", "po number")
+            if prev.text == label_type and text in ("#", "no", "number"):
+                two_word_labels.append((prev.x0, w.x1, w.top))
+            # For PO labels, include "purchase order" as two-word label
+            elif label_type == "po" and prev.text == "purchase" and text == "order":
+                purchase_order_labels.append((prev.x0, w.x1, prev.top))
+
+        # Single-word labels
+        if label_type == "invoice" and text == "invoice":
+            # Skip if "original" is directly before "invoice"
+            # Skip if "date" or "date:" is directly after "invoice" and "invoice" is not "invoice:"
+            if not (
+                (prev is not None and prev.text == "original") or
+                (
+                    idx < last_idx and
+                    normalized_words[idx + 1].text in ("date", "date:") and
+                    w.orig.strip().lower() != "invoice:"
+                )
+            ):
+                single_word_labels.append((w.x0, w.x1, w.top))
+        elif label_type == "po" and text == "po":
+            single_word_labels.append((w.x0, w.x1, w.top))
+
+        prev = w
+
+    label_positions = two_word_labels + purchase_order_labels + single_word_labels
     return label_positions
 
 def find_value_to_right(normalized_words, label_positions, validation_func, strict=True):
     """
     Find a value to the right of any label in label_positions
     """
+    # Geometry is filtered once per label at the widest tolerance in use, so
+    # the looser pass reuses it and validation only runs on words in reach
+    reach = 5 if strict else 20
+    in_reach_by_label = []
+    validation_func = _memoized(validation_func)
+
     # Strict matching (very close horizontally)
     for pos in label_positions:
-        # Extract only the needed values using slicing
-        label_x0, label_x1, label_y = pos[0], pos[1], pos[2]
-        
-        candidates = [
-            w for w in normalized_words
-            if w["x0"] > label_x1 and abs(w["top"] - label_y) <= 5 and validation_func(w["text"])
-        ]
+        label_x1, label_y = pos[1], pos[2]
+
+        in_reach = []
+        for w in _words_in_band(normalized_words, label_y - reach - 1, label_y + reach + 1):
+            if w.x0 > label_x1:
+                dy = abs(w.top - label_y)
+                if dy <= reach:
+                    in_reach.append((dy, w))
+        in_reach_by_label.append(in_reach)
+
+        candidates = [(dy, w) for dy, w in in_reach if dy <= 5 and validation_func(w.text)]
         if candidates:
-            best = sorted(candidates, key=lambda x: abs(x["top"] - label_y))[0]
-            logger.debug(f"Value (direct right match): {best['orig']}")
-            return best["orig"].lstrip("#:").strip()
+            best = min(candidates, key=itemgetter(0))[1]
+            logger.debug("Value (direct right match): %s", best.orig)
+            return best.orig.lstrip("#:").strip()
     
     # Looser matching if strict didn't find anything
     if not strict:
-        for pos in label_positions:
-            label_x0, label_x1, label_y = pos[0], pos[1], pos[2]
-            
-            candidates = [
-                w for w in normalized_words
-                if w["x0"] > label_x1 and abs(w["top"] - label_y) <= 20 and validation_func(w["text"])
-            ]
+        for in_reach in in_reach_by_label:
+            candidates = [(dy, w) for dy, w in in_reach if validation_func(w.text)]
             if candidates:
-                best = sorted(candidates, key=lambda x: abs(x["top"] - label_y))[0]
-                return best["orig"].lstrip("#:").strip()
+                best = min(candidates, key=itemgetter(0))[1]
+                return best.orig.lstrip("#:").strip()
     
     return None
 
@@ -154,24 +285,27 @@ def find_value_below(normalized_words, label_positions, validation_func, max_dis
     """
     best_candidate = None
     best_score = float("inf")
+    validation_func = _memoized(validation_func)
+
+    for label_x0, label_x1, label_y in label_positions:
+        for w in _words_in_band(normalized_words, label_y - 1, label_y + max_distance + 1):
+            mid_x = (w.x0 + w.x1) / 2
+            if not label_x0 <= mid_x <= label_x1:
+                continue
+            vertical_distance = w.top - label_y
 
-    for label_idx, (label_x0, label_x1, label_y) in enumerate(label_positions):
-        for w in normalized_words:
-            mid_x = (w["x0"] + w["x1"]) / 2
-            vertical_distance = w["top"] - label_y
-            
+            # Only validate words that would improve on the current best
             if (
-                label_x0 <= mid_x <= label_x1 and
                 0 < vertical_distance <= max_distance and
-                validation_func(w["text"])
+                vertical_distance < best_score and
+                validation_func(w.text)
             ):
-                if vertical_distance < best_score:
-                    best_score = vertical_distance
-                    best_candidate = w
+                best_score = vertical_distance
+                best_candidate = w
     
     if best_candidate:
-        logger.debug(f"Value (below fallback best): {best_candidate['orig']}")
-        return best_candidate["orig"].lstrip("#:").strip()
+        logger.debug("Value (below fallback best): %s", best_candidate.orig)
+        return best_candidate.orig.lstrip("#:").strip()
     
     return None
 
@@ -180,10 +314,10 @@ def search_for_pattern(normalized_words, pattern, case_sensitive=False):
     Search for words matching a specific regex pattern
     """
     flags = 0 if case_sensitive else re.IGNORECASE
-    matches = [w for w in normalized_words if re.match(pattern, w["orig"].strip(), flags)]
+    matches = [w for w in normalized_words if re.match(pattern, w.orig.strip(), flags)]
     
     if matches:
-        logger.debug(f"Pattern match found: {matches[0]['orig']}")
-        return matches[0]["orig"].strip()
+        logger.debug("Pattern match found: %s", matches[0].orig)
+        return matches[0].orig.strip()
     
     return None
\ No newline at end of file
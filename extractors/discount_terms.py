@@ -1,431 +1,560 @@
 import re
+from datetime import date
+from functools import lru_cache
+from .common_extraction import joined_text_upper
+from .invoice_date import extract_invoice_date
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
-def extract_discount_terms(words, vendor_name):
-    all_text = " ".join([w["text"] for w in words]).upper()
-
-    # Tite Line-specific: Check for "2% / 15 net 30" format
-    if vendor_name == "Tite Line Fishing Products LLC":
-        titeline_pattern = r'(\d{1,2})%\s*/\s*(\d{1,3})\s*NET\s*(\d{1,3})'
-        titeline_match = re.search(titeline_pattern, all_text)
-        if titeline_match:
-            discount_percent = titeline_match.group(1)
-            discount_days = titeline_match.group(2)
-            net_days = titeline_match.group(3)
-            result = f"{discount_percent}% {discount_days} NET {net_days}"
-            logger.debug(f"Found Tite Line discount terms: {result}")
-            return result
-
-    # Sherpa-specific: Handle "60 DAYS" format
-    if vendor_name == "Sherpa":
-        sherpa_pattern = r'\b(\d{1,3})\s+DAYS\b'
-        sherpa_match = re.search(sherpa_pattern, all_text)
-        if sherpa_match:
-            days = sherpa_match.group(1)
-            result = f"NET {days}"
-            logger.debug(f"Found Sherpa discount terms: {result}")
-            return result
-
-    # Blundstone-specific: Handle "3% DISCOUNT, 45 DAYS" format
-    if vendor_name == "Blundstone":
-        blundstone_pattern = r'(\d{1,2})%\s*DISCOUNT,?\s*(\d{1,3})\s*DAYS'
-        blundstone_match = re.search(blundstone_pattern, all_text)
-        if blundstone_match:
-            discount_percent = blundstone_match.group(1)
-            days = blundstone_match.group(2)
-            result = f"{discount_percent}% {days}"
-            logger.debug(f"Found Blundstone discount terms: {result}")
+# Special word groups that are returned as the terms when found near the top
+_SPECIAL_TERMS = (
+    "STATEMENT",
+    "CREDIT MEMO",
+    "CREDIT NOTE",
+    "WARRANTY",
+    "RETURN AUTHORIZATION",
+    "DEFECTIVE",
+    "NO TERMS",
+    "PRODUCT RETURN",
+    "PARTS MISSING",
+    "RA FOR CREDIT"
+)
+# The longest word of each special term. Each key is looked for once in the
+# first words and only the terms whose key is present are checked.
+_SPECIAL_TERM_KEY = {term: max(term.split(), key=len) for term in _SPECIAL_TERMS}
+_SPECIAL_TERM_KEYS = frozenset(_SPECIAL_TERM_KEY.values())
+# Vendors whose special terms only appear near the top of the document
+_SPECIAL_TERM_WORD_LIMITS = {"Cotopaxi": 25}
+# Texts shorter than this cannot hold any special term
+_SHORTEST_SPECIAL_TERM = min(map(len, _SPECIAL_TERMS))
+
+# Special cases of terms (rules 1-7)
+_SPECIAL_CASE_SOURCES = (
+    ("days_net", r"\b(?P<days_net_n>\d{1,3})\s+DAYS\s+NET\b"),                       # 1. "90 DAYS NET"
+    ("net_terms", r"\bNET\s+TERMS\s+(?P<net_terms_n>\d{1,3})\b"),                    # 2. "NET TERMS 30"
+    ("days_stripe", r"\b(?P<days_stripe_n>\d{1,3})\s+DAYS\s+STRIPE\b"),              # 3. "30 DAYS STRIPE"
+    ("net_comma", r"NET\s*(?P<net_comma_net>\d{1,3}),?\s*(?P<net_comma_second>\d{1,3})\s*(?P<net_comma_pct>\d{1,2})%"),  # 4. "NET 120, 75 10%"
+    ("net_d", r"NET\s*(?P<net_d_n>\d{1,2})\s*D\b"),                                   # 5. "NET xxD"
+    ("payment_days", r"PAYMENT\s*(?P<payment_days_n>\d{1,3})\s*DAYS"),               # 6. "PAYMENT 90 DAYS"
+    # 7. "x/x/NET xx or x/xx/NET xx" (National Geographic Maps)
+    ("slash_net", r"\b(?P<slash_net_pct>\d{1,2})\s*\/\s*(?P<slash_net_days>\d{1,3})\s*\/\s*NET\s*(?P<slash_net_net>\d{1,3})\b"),
+)
+
+# Existing patterns
+_FALLBACK_SOURCES = (
+    r"\b\d{1,2}%\s*\d{1,3},?\s*[nN]\d{1,3}\b",      # x% xx, nxxx or xx% xxx nxxx (lowercase n variant)
+    r"\b\d{1,2}%\s*[nN]\d{1,3}\b",                  # x%Nxx or x% nxx (e.g., 8%N45)
+    r"\b\d{1,2}%\s*NET\s*\d{1,3}\b",                # x% NET xx or xx% NET xx
+    r"\b\d{1,2}%\s*\d{1,2},?\s*NET\s*\d{1,3}\b",    # x% xx NET xx or xx% xx NET xx
+    r"\bNET\s*\d{1,3}\b",                           # NET xx or NET xxx
+    r"\bNET\s+DUE\s+IN\s+(?P<due_in>\d{1,3})\b",     # NET DUE IN xx
+    r"\b\d{1,2}%\s*\d{1,2}\s*NET EOFM\b",           # x% xx NET EOFM or xx% xx NET EOFM (Fulling Mill)
+    r"\b\d{4}NET\d{2,3}\b",                         # xxxxNETxx or xxxxNETxxx (10% 60 NET 61 = 1060NET61)
+    r"\b\d{3}NET\d{2}\b"                            # xxxNETxx (single digit % like 1% 60 NET 61 = 160NET61)
+)
+_FALLBACK_PATTERNS = tuple(re.compile(p) for p in _FALLBACK_SOURCES)
+
+# Rules 1-7 and the fallback patterns, fused into one scan. Each rule sits
+# inside a lookahead so every start position reports the first rule matching
+# there; the lowest-ranked rule seen anywhere wins, at the position a search
+# for it alone would report - exactly like searching the rules one after
+# another. The leading [\dNP] check lets the scan skip positions no rule can
+# start at.
+_TERMS_RULES = _SPECIAL_CASE_SOURCES + tuple((f"fb{i}", p) for i, p in enumerate(_FALLBACK_SOURCES))
+_RE_TERMS = re.compile(
+    r"(?=[\dNP])(?="
+    + "|".join(f"(?P<{name}>{p})" for name, p in _TERMS_RULES)
+    + ")"
+)
+# The same scan for ASCII-only text, as a bytes pattern (scans about a quarter
+# faster). Bytes \s leaves out the \x1c-\x1f separators that str \s matches,
+# so they are added back; \d and \b already agree on ASCII.
+_RE_TERMS_ASCII = re.compile(_RE_TERMS.pattern.replace(r"\s", r"[\s\x1c-\x1f]").encode("ascii"))
+_TERMS_RANK = {name: rank for rank, (name, _) in enumerate(_TERMS_RULES, 1)}
+_SLASH_NET_RANK = _TERMS_RANK["slash_net"]
+_FALLBACK_RANK = _TERMS_RANK["fb0"]
+_NO_MATCH_RANK = len(_TERMS_RULES) + 1
+
+# Vendors whose terms are fixed once none of the special cases (rules 1-7) apply
+_VENDOR_TERM_OVERRIDES = {
+    "Badfish": "NET 30",
+    "Patagonia": "NET 60",
+    "Dapper Ink LLC": "DUE TODAY",
+}
+
+# Vendors whose terms also depend on the word layout (invoice date, Memo
+# position), not just the text - they are never served from the text cache
+_LAYOUT_VENDORS = frozenset({"Patagonia", "Soto", "Seirus Innovation", "Rumpl"})
+
+# Defaults for vendors when no terms are found at all
+_VENDOR_DEFAULT_TERMS = {
+    "Gear Aid": "NET 60",
+    "Scout Curated Wears": "NET 30",
+    "Turtlebox Audio LLC": "NET 30",
+    "Chaos Headwear": "DUE TODAY",
+    "Nocqua": "DUE TODAY",
+    "K'Lani LLC": "DUE TODAY",
+}
+
+# Vendor-specific formats
+_RE_TITELINE = re.compile(r'(\d{1,2})%\s*/\s*(\d{1,3})\s*NET\s*(\d{1,3})')             # "2% / 15 NET 30"
+_RE_SHERPA = re.compile(r'\b(\d{1,3})\s+DAYS\b')                                        # "60 DAYS"
+_RE_BLUNDSTONE = re.compile(r'(\d{1,2})%\s*DISCOUNT,?\s*(\d{1,3})\s*DAYS')              # "3% DISCOUNT, 45 DAYS"
+_RE_DUE_DATE = re.compile(r'DUE\s+DATE\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})')                 # Patagonia/Soto "DUE DATE 1/10/2026"
+_RE_SEIRUS_DATE_TERMS = re.compile(r'(\d{1,2})%\s*(\d{1,2}/\d{1,2})\s*NET\s*(\d{1,2}/\d{1,2})')  # "2% 12/10 NET 12/11"
+_RE_ARTILECT = re.compile(r"(\d{1,3})\s*DAYS\s*PAYMENT\s*TERMS")                         # "60 DAYS PAYMENT TERMS"
+_RE_FISHPOND = re.compile(r"(\d{1,2})%\s*(\d{1,3}),\s*\d{1,2}%\s*\d{1,3},\s*NET\s*(\d{1,3})")  # "10% 30, 4% 60, NET 61"
+_RE_OBOZ = re.compile(r"(\d{1,2})%NET\s*(\d{1,3})")                                      # "4%NET 30"
+_RE_SEA_TO_SUMMIT = re.compile(r"(\d{1,2})%\s*(\d{1,3})\s*/\s*NET\s*(\d{1,3})")         # "8% 60 / NET 61"
+_RE_CAMP_USA = re.compile(r"(\d{1,2})%\s*(\d{1,3})/NET\s*(\d{1,3})")                     # "8% 60/NET 61"
+_RE_HESTRA_WITH_PERCENT = re.compile(r"(\d{1,2})%[nN](\d{1,3})\b")                        # "8%N90"
+_RE_HESTRA_NO_PERCENT = re.compile(r"\b[nN](\d{1,3})\b")                                  # "N90"
+# BIG Adventures: x% NET xx, x% xx NET xx and NET xx (fallback patterns 3-5)
+_BIG_ADVENTURES_PATTERNS = _FALLBACK_PATTERNS[2:5]
+_RE_BIG_ADVENTURES_DISCOUNT = re.compile(r"DISCOUNT\s+OF\s+(\d{1,2})%,\s*(?:\(CID:\d+\))?\s*\$?[\d,]+\.?\d*")
+_RE_PERCENTAGE = re.compile(r"(\d{1,2})%")                                                # Rumpl memo "7%"
+
+# Invoice and due dates in the exact "%m/%d/%y" and "%m/%d/%Y" shapes strptime
+# accepts, so they can be parsed without it (see _parse_mdy)
+_STRPTIME_MONTH = r"(1[0-2]|0[1-9]|[1-9])"
+_STRPTIME_DAY = r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+_RE_MDY_SHORT_YEAR = re.compile(_STRPTIME_MONTH + "/" + _STRPTIME_DAY + r"/(\d\d)")
+_RE_MDY_LONG_YEAR = re.compile(_STRPTIME_MONTH + "/" + _STRPTIME_DAY + r"/(\d\d\d\d)")
+
+# Liberty Mountain Sports no-space formats
+# (the shapes are fallback patterns 8 and 9 - reuse their compiled forms)
+_RE_LIB_MTN_4 = _FALLBACK_PATTERNS[7]
+_RE_LIB_MTN_4_DIGITS = re.compile(r"(\d{2})(\d{2})NET(\d{2,3})")
+_RE_LIB_MTN_3 = _FALLBACK_PATTERNS[8]
+_RE_LIB_MTN_3_DIGITS = re.compile(r"(\d)(\d{2})NET(\d{2})")
+
+# Cleanup of a matched terms value
+_RE_N_TO_NET = re.compile(r'\b([nN])(\d)')
+# One pass that turns commas into spaces and inserts a space after a % followed
+# by a digit and at every digit/letter boundary
+_RE_TERMS_SPACING = re.compile(r',|(?<=%)(?=\d)|(?<=\d)(?=[A-Z])|(?<=[A-Z])(?=\d)')
+
+def extract_discount_terms(words, vendor_name, text_upper=None):
+    # text_upper may be passed in by extract_fields, which joins each document once
+    if text_upper is not None:
+        all_text = text_upper
+    else:
+        all_text = joined_text_upper(words)
+
+    if vendor_name in _LAYOUT_VENDORS:
+        return _extract_terms(words, all_text, vendor_name)
+    return _extract_terms_from_text(all_text, vendor_name)
+
+@lru_cache(maxsize=32)
+def _extract_terms_from_text(all_text, vendor_name):
+    """Terms for vendors that only read the text (memoized - the quantity,
+    shipping, total and invoice number extractors each ask for the terms of
+    the same document)."""
+    return _extract_terms(None, all_text, vendor_name)
+
+def _extract_terms(words, all_text, vendor_name):
+    # Vendor-specific formats checked before the generic rules
+    handler = _VENDOR_PRE_HANDLERS.get(vendor_name)
+    if handler:
+        result = handler(words, all_text, vendor_name)
+        if result:
             return result
 
-    # Patagonia and Soto-specific: Calculate NET terms from Due Date - Invoice Date
-    if vendor_name in ["Patagonia", "Soto"]:
-        from .invoice_date import extract_invoice_date
-        from datetime import datetime
-
-        # Look for "Due date" label and extract the date
-        due_date_pattern = r'DUE\s+DATE\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})'
-        due_date_match = re.search(due_date_pattern, all_text)
-
-        if due_date_match:
-            due_date_str = due_date_match.group(1)  # e.g., "1/10/2026"
-
-            # Get invoice date
-            invoice_date_str = extract_invoice_date(words, vendor_name)
-            if invoice_date_str:
-                try:
-                    # Parse invoice date (format: MM/DD/YY)
-                    invoice_date = datetime.strptime(invoice_date_str, "%m/%d/%y")
-
-                    # Parse due date (format: M/D/YYYY or MM/DD/YYYY)
-                    due_date = datetime.strptime(due_date_str, "%m/%d/%Y")
-
-                    # Calculate days difference
-                    net_days = (due_date - invoice_date).days
-
-                    result = f"NET {net_days}"
-                    logger.debug(f"Found Patagonia calculated terms: {result}")
-                    return result
-                except Exception as e:
-                    logger.error(f"Failed to calculate Patagonia terms from due date: {e}")
-                    # Fall through to default NET 60
-
-    # Seirus-specific: Check for date-based terms format: "2% 12/10 Net 12/11"
-    if vendor_name == "Seirus Innovation":
-        date_terms_pattern = r'(\d{1,2})%\s*(\d{1,2}/\d{1,2})\s*NET\s*(\d{1,2}/\d{1,2})'
-        date_terms_match = re.search(date_terms_pattern, all_text)
-        if date_terms_match:
-            from .invoice_date import extract_invoice_date
-            from datetime import datetime
-
-            discount_percent = date_terms_match.group(1)
-            discount_date_str = date_terms_match.group(2)  # e.g., "12/10"
-            net_date_str = date_terms_match.group(3)  # e.g., "12/11"
-
-            # Get invoice date
-            invoice_date_str = extract_invoice_date(words, vendor_name)
-            if invoice_date_str:
-                try:
-                    # Parse invoice date (format: MM/DD/YY)
-                    invoice_date = datetime.strptime(invoice_date_str, "%m/%d/%y")
-
-                    # Parse discount and net dates (format: M/D or MM/DD)
-                    # Assume same year as invoice, or next year if month has passed
-                    discount_month, discount_day = map(int, discount_date_str.split('/'))
-                    net_month, net_day = map(int, net_date_str.split('/'))
-
-                    # Create dates with invoice year
-                    discount_date = datetime(invoice_date.year, discount_month, discount_day)
-                    net_date = datetime(invoice_date.year, net_month, net_day)
-
-                    # If discount date is before invoice date, assume next year
-                    if discount_date < invoice_date:
-                        discount_date = datetime(invoice_date.year + 1, discount_month, discount_day)
-                        net_date = datetime(invoice_date.year + 1, net_month, net_day)
-
-                    # Calculate days difference
-                    discount_days = (discount_date - invoice_date).days
-                    net_days = (net_date - invoice_date).days
-
-                    result = f"{discount_percent}% {discount_days} NET {net_days}"
-                    logger.debug(f"Found date-based discount terms: {result}")
-                    return result
-                except Exception as e:
-                    logger.error(f"Failed to parse date-based discount terms: {e}")
-                    # Fall through to regular patterns
-    
     # Check for special word groups in the first 100 words only
-    all_text_words = all_text.split()
-    if vendor_name == "Cotopaxi":
-        first_n_words = " ".join(all_text_words[:25])
+    if len(all_text) >= _SHORTEST_SPECIAL_TERM:
+        limit = _SPECIAL_TERM_WORD_LIMITS.get(vendor_name, 100)
+        # Split off just the first words rather than tokenizing the whole text;
+        # the key checks below then only scan those words, not the whole document
+        first_n_words = " ".join(all_text.split(None, limit)[:limit])
+        present_keys = {key for key in _SPECIAL_TERM_KEYS if key in first_n_words}
+        if present_keys:
+            for term in _SPECIAL_TERMS:
+                if _SPECIAL_TERM_KEY[term] in present_keys and term in first_n_words:
+                    # Skip "STATEMENT" if it's part of "NO STATEMENT"
+                    if term == "STATEMENT" and "NO STATEMENT" in first_n_words:
+                        continue
+                    logger.debug(f"Found Discount Terms: {term}")
+                    return term
+
+    # The generic rules below all need one of these literals to match, so
+    # texts without them skip straight to the vendor checks and defaults
+    if "NET" in all_text or "DAYS" in all_text or "%" in all_text:
+        best, best_rank = _scan_terms(all_text)
     else:
-        first_n_words = " ".join(all_text_words[:100])
-
-    special_terms = [
-        "STATEMENT",
-        "CREDIT MEMO",
-        "CREDIT NOTE",
-        "WARRANTY",
-        "RETURN AUTHORIZATION",
-        "DEFECTIVE",
-        "NO TERMS",
-        "PRODUCT RETURN",
-        "PARTS MISSING",
-        "RA FOR CREDIT"
-    ]
-    for term in special_terms:
-        if term in first_n_words:
-            # Skip "STATEMENT" if it's part of "NO STATEMENT"
-            if term == "STATEMENT" and "NO STATEMENT" in first_n_words:
-                continue
-            logger.debug(f"Found Discount Terms: {term}")
-            return term
+        best, best_rank = None, _NO_MATCH_RANK
 
-    # Special cases of terms
-    # 1. "90 DAYS NET" -> "NET 90"
-    match = re.search(r"\b(\d{1,3})\s+DAYS\s+NET\b", all_text)
-    if match:
-        result = f"NET {match.group(1)}"
+    # Special cases of terms (rules 1-6)
+    if best_rank < _SLASH_NET_RANK:
+        result = _special_case_terms(best)
         logger.debug(f"Found Discount Terms: {result}")
         return result
 
-    # 2. "NET TERMS 30" -> "NET 30"
-    match = re.search(r"\bNET\s+TERMS\s+(\d{1,3})\b", all_text)
-    if match:
-        result = f"NET {match.group(1)}"
+    # Artilect-specific: "60 DAYS PAYMENT TERMS" -> "NET 60"
+    if vendor_name == "Artilect":
+        match = _RE_ARTILECT.search(all_text)
+        if match:
+            result = f"NET {match.group(1)}"
+            logger.debug(f"Found Artilect discount terms: {result}")
+            return result
+
+    # 7. "x/x/NET xx or x/xx/NET xx" -> "x% xx NET xx" (National Geographic Maps)
+    if best_rank == _SLASH_NET_RANK:
+        result = f"{best['slash_net_pct']}% {best['slash_net_days']} NET {best['slash_net_net']}"
         logger.debug(f"Found Discount Terms: {result}")
         return result
 
-    # 3. "30 DAYS STRIPE" -> "NET 30"
-    match = re.search(r"\b(\d{1,3})\s+DAYS\s+STRIPE\b", all_text)
-    if match:
-        result = f"NET {match.group(1)}"
-        logger.debug(f"Found Discount Terms: {result}")
+    override = _VENDOR_TERM_OVERRIDES.get(vendor_name)
+    if override:
+        return override
+
+    # Vendor-specific formats checked once the generic rules 1-7 found nothing
+    handler = _VENDOR_HANDLERS.get(vendor_name)
+    if handler:
+        result = handler(words, all_text, vendor_name)
+        if result:
+            return result
+
+    for match, group in _iter_fallback_matches(all_text, best, best_rank):
+        value = match.group(group)
+
+        # Skip if this is part of a product description (e.g., "MOSQUITO NET")
+        match_start = match.start(group)
+        match_end = match.end(group)
+        context_start = max(0, match_start - 20)
+        context_end = min(len(all_text), match_end + 20)
+        context = all_text[context_start:context_end]
+        if "MOSQUITO" in context:
+            continue
+        # Liberty Mountain Sports: insert % and spaces for no-space format
+        if vendor_name == "Liberty Mountain Sports":
+            # Handle 4-digit format: 1060NET61 -> 10% 60 NET 61
+            if _RE_LIB_MTN_4.match(value):
+                digits = _RE_LIB_MTN_4_DIGITS.match(value)
+                if digits:
+                    value = f"{digits.group(1)}% {digits.group(2)} NET {digits.group(3)}"
+            # Handle 3-digit format: 160NET61 -> 1% 60 NET 61
+            elif _RE_LIB_MTN_3.match(value):
+                digits = _RE_LIB_MTN_3_DIGITS.match(value)
+                if digits:
+                    value = f"{digits.group(1)}% {digits.group(2)} NET {digits.group(3)}"
+        # Normalize lowercase 'n' to uppercase 'NET' (e.g., "9% 90, n105" -> "9% 90, NET105")
+        value = _RE_N_TO_NET.sub(r'NET\2', value)
+        value = _tidy_terms(value)
+        if "DUE IN" in value:
+            net_days = match.group("due_in")
+            result = f"NET {net_days}"
+            logger.debug(f"Found Discount Terms: {result}")
+            return result
+        # logger.debug(f" Found Discount Terms: {value}")
+        return value
+
+    # Vendor defaults when no terms were found
+    return _VENDOR_DEFAULT_TERMS.get(vendor_name, "")
+
+def _iter_fallback_matches(all_text, best, best_rank):
+    """Yield (match, group) for each fallback pattern that matches, in priority order.
+
+    best and best_rank come from _scan_terms; by the time the fallback
+    patterns are tried, best can only be one of them (or None).
+    """
+    if best is None:
+        return
+    yield best, best.lastgroup
+    # Later patterns are only reached when the caller skipped that match
+    for pattern in _FALLBACK_PATTERNS[best_rank - _FALLBACK_RANK + 1:]:
+        match = pattern.search(all_text)
+        if match:
+            yield match, 0
+
+def _tite_line_terms(words, all_text, vendor_name):
+    """Tite Line: "2% / 15 NET 30" -> "2% 15 NET 30"."""
+    titeline_match = _RE_TITELINE.search(all_text)
+    if titeline_match:
+        discount_percent = titeline_match.group(1)
+        discount_days = titeline_match.group(2)
+        net_days = titeline_match.group(3)
+        result = f"{discount_percent}% {discount_days} NET {net_days}"
+        logger.debug(f"Found Tite Line discount terms: {result}")
         return result
 
-    # 4. "NET 120, 75 10%" -> "10% 75 NET 120"
-    match = re.search(r"NET\s*(\d{1,3}),?\s*(\d{1,3})\s*(\d{1,2})%\s*", all_text)
+def _sherpa_terms(words, all_text, vendor_name):
+    """Sherpa: "60 DAYS" -> "NET 60"."""
+    sherpa_match = _RE_SHERPA.search(all_text)
+    if sherpa_match:
+        days = sherpa_match.group(1)
+        result = f"NET {days}"
+        logger.debug(f"Found Sherpa discount terms: {result}")
+        return result
+
+def _blundstone_terms(words, all_text, vendor_name):
+    """Blundstone: "3% DISCOUNT, 45 DAYS" -> "3% 45"."""
+    blundstone_match = _RE_BLUNDSTONE.search(all_text)
+    if blundstone_match:
+        discount_percent = blundstone_match.group(1)
+        days = blundstone_match.group(2)
+        result = f"{discount_percent}% {days}"
+        logger.debug(f"Found Blundstone discount terms: {result}")
+        return result
+
+def _due_date_terms(words, all_text, vendor_name):
+    """Patagonia and Soto: calculate NET terms from Due Date - Invoice Date."""
+    # Look for "Due date" label and extract the date
+    due_date_match = _RE_DUE_DATE.search(all_text)
+
+    if due_date_match:
+        due_date_str = due_date_match.group(1)  # e.g., "1/10/2026"
+
+        # Get invoice date
+        invoice_date_str = extract_invoice_date(words, vendor_name)
+        if invoice_date_str:
+            try:
+                # Parse invoice date (format: MM/DD/YY)
+                invoice_date = _parse_mdy(invoice_date_str, _RE_MDY_SHORT_YEAR)
+
+                # Parse due date (format: M/D/YYYY or MM/DD/YYYY)
+                due_date = _parse_mdy(due_date_str, _RE_MDY_LONG_YEAR)
+
+                # Calculate days difference
+                net_days = due_date.toordinal() - invoice_date.toordinal()
+
+                result = f"NET {net_days}"
+                logger.debug(f"Found Patagonia calculated terms: {result}")
+                return result
+            except Exception as e:
+                logger.error(f"Failed to calculate Patagonia terms from due date: {e}")
+                # Fall through to default NET 60
+
+def _seirus_terms(words, all_text, vendor_name):
+    """Seirus: date-based terms "2% 12/10 Net 12/11" -> "2% xx NET yy" (days from the invoice date)."""
+    date_terms_match = _RE_SEIRUS_DATE_TERMS.search(all_text)
+    if date_terms_match:
+        discount_percent = date_terms_match.group(1)
+        discount_date_str = date_terms_match.group(2)  # e.g., "12/10"
+        net_date_str = date_terms_match.group(3)  # e.g., "12/11"
+
+        # Get invoice date
+        invoice_date_str = extract_invoice_date(words, vendor_name)
+        if invoice_date_str:
+            try:
+                # Parse invoice date (format: MM/DD/YY)
+                invoice_date = _parse_mdy(invoice_date_str, _RE_MDY_SHORT_YEAR)
+
+                # Parse discount and net dates (format: M/D or MM/DD)
+                # Assume same year as invoice, or next year if month has passed
+                discount_month, discount_day = map(int, discount_date_str.split('/'))
+                net_month, net_day = map(int, net_date_str.split('/'))
+
+                # Create dates with invoice year
+                discount_date = date(invoice_date.year, discount_month, discount_day)
+                net_date = date(invoice_date.year, net_month, net_day)
+
+                # If discount date is before invoice date, assume next year
+                if discount_date < invoice_date:
+                    discount_date = date(invoice_date.year + 1, discount_month, discount_day)
+                    net_date = date(invoice_date.year + 1, net_month, net_day)
+
+                # Calculate days difference
+                invoice_day = invoice_date.toordinal()
+                discount_days = discount_date.toordinal() - invoice_day
+                net_days = net_date.toordinal() - invoice_day
+
+                result = f"{discount_percent}% {discount_days} NET {net_days}"
+                logger.debug(f"Found date-based discount terms: {result}")
+                return result
+            except Exception as e:
+                logger.error(f"Failed to parse date-based discount terms: {e}")
+                # Fall through to regular patterns
+
+def _rumpl_terms(words, all_text, vendor_name):
+    """Rumpl: percentage next to the "Memo" label at the same Y-coordinate."""
+    memo_percentage = _extract_rumpl_memo_percentage(words)
+    if memo_percentage:
+        return memo_percentage
+
+def _fishpond_terms(words, all_text, vendor_name):
+    """Fishpond: "10% 30, 4% 60, NET 61" -> "10% 30 NET 61"."""
+    # Look for pattern like "10% 30, 4% 60, NET 61"
+    match = _RE_FISHPOND.search(all_text)
     if match:
-        # percent, second number, net days
-        percent = match.group(3)
-        second = match.group(2)
-        net_days = match.group(1)
-        result = f"{percent}% {second} NET {net_days}"
+        result = f"{match.group(1)}% {match.group(2)} NET {match.group(3)}"
         logger.debug(f"Found Discount Terms: {result}")
         return result
 
-    # 5. "NET xxD" -> "NET xx" (Grundens and similar cases)
-    match = re.search(r"NET\s*(\d{1,2})\s*D\b", all_text)
+def _oboz_terms(words, all_text, vendor_name):
+    """Oboz: "4%NET 30" -> "4% NET 30"."""
+    # Look for pattern like "x%NET xx"
+    match = _RE_OBOZ.search(all_text)
     if match:
-        result = f"NET {match.group(1)}"
+        result = f"{match.group(1)}% NET {match.group(2)}"
         logger.debug(f"Found Discount Terms: {result}")
         return result
-    
-    # 6. "PAYMENT 90 DAYS" -> "NET 90"
-    match = re.search(r"PAYMENT\s*(\d{1,3})\s*DAYS", all_text)
+
+def _sea_to_summit_terms(words, all_text, vendor_name):
+    """Sea to Summit: "8% 60 / NET 61" -> "8% 60 NET 61"."""
+    # Look for pattern like "x% yy / NET zz"
+    match = _RE_SEA_TO_SUMMIT.search(all_text)
     if match:
-        result = f"NET {match.group(1)}"
+        result = f"{match.group(1)}% {match.group(2)} NET {match.group(3)}"
         logger.debug(f"Found Discount Terms: {result}")
         return result
 
-    # Artilect-specific: "60 DAYS PAYMENT TERMS" -> "NET 60"
-    if vendor_name == "Artilect":
-        match = re.search(r"(\d{1,3})\s*DAYS\s*PAYMENT\s*TERMS", all_text)
-        if match:
-            result = f"NET {match.group(1)}"
-            logger.debug(f"Found Artilect discount terms: {result}")
-            return result
-
-    # 7. "x/x/NET xx or x/xx/NET xx" -> "x% xx NET xx" (National Geographic Maps)
-    match = re.search(r"\b(\d{1,2})\s*\/\s*(\d{1,3})\s*\/\s*NET\s*(\d{1,3})\b", all_text)
+def _camp_usa_terms(words, all_text, vendor_name):
+    """Camp USA: "8% 60/Net 61" -> "8% 60 NET 61"."""
+    # Look for pattern like "x% yy/Net zz" (case insensitive)
+    match = _RE_CAMP_USA.search(all_text)
     if match:
         result = f"{match.group(1)}% {match.group(2)} NET {match.group(3)}"
-        logger.debug(f"Found Discount Terms: {result}")
+        logger.debug(f"Found Camp USA discount terms: {result}")
         return result
-    
-    if vendor_name == "Badfish":
-        return "NET 30"  # Special case for Badfish
-    
-    if vendor_name == "Patagonia":
-        return "NET 60"  # Special case for Patagonia
-    
-    if vendor_name == "Dapper Ink LLC":
-        return "DUE TODAY"
-
-    # Rumpl-specific format: Look for "Memo" label with percentage at same Y-coordinate
-    if vendor_name == "Rumpl":
-        memo_percentage = _extract_rumpl_memo_percentage(words)
-        if memo_percentage:
-            return memo_percentage
-
-    # Fishpond-specific format: "10% 30, 4% 60, NET 61" -> "10% 30 NET 61"
-    if vendor_name == "Fishpond":
-        # Look for pattern like "10% 30, 4% 60, NET 61"
-        fishpond_pattern = r"(\d{1,2})%\s*(\d{1,3}),\s*\d{1,2}%\s*\d{1,3},\s*NET\s*(\d{1,3})"
-        match = re.search(fishpond_pattern, all_text)
-        if match:
-            result = f"{match.group(1)}% {match.group(2)} NET {match.group(3)}"
-            logger.debug(f"Found Discount Terms: {result}")
-            return result
-    
-    # Oboz-specific format: "4%NET 30" -> "4% NET 30"
-    if vendor_name == "Oboz Footwear LLC":
-        # Look for pattern like "x%NET xx"
-        oboz_pattern = r"(\d{1,2})%NET\s*(\d{1,3})"
-        match = re.search(oboz_pattern, all_text)
-        if match:
-            result = f"{match.group(1)}% NET {match.group(2)}"
-            logger.debug(f"Found Discount Terms: {result}")
-            return result
-    
-    # Sea to Summit-specific format: "8% 60 / NET 61" -> "8% 60 NET 61"
-    if vendor_name == "Sea to Summit":
-        # Look for pattern like "x% yy / NET zz"
-        sea_to_summit_pattern = r"(\d{1,2})%\s*(\d{1,3})\s*/\s*NET\s*(\d{1,3})"
-        match = re.search(sea_to_summit_pattern, all_text)
-        if match:
-            result = f"{match.group(1)}% {match.group(2)} NET {match.group(3)}"
-            logger.debug(f"Found Discount Terms: {result}")
-            return result
 
-    # Camp USA-specific format: "8% 60/Net 61" -> "8% 60 NET 61"
-    if vendor_name == "Camp USA":
-        # Look for pattern like "x% yy/Net zz" (case insensitive)
-        camp_usa_pattern = r"(\d{1,2})%\s*(\d{1,3})/NET\s*(\d{1,3})"
-        match = re.search(camp_usa_pattern, all_text)
-        if match:
-            result = f"{match.group(1)}% {match.group(2)} NET {match.group(3)}"
-            logger.debug(f"Found Camp USA discount terms: {result}")
-            return result
+def _hestra_terms(words, all_text, vendor_name):
+    """Hestra: "8%N90" -> "8% NET 90" or "N90" -> "NET 90"."""
+    # Look for pattern like "xx%Nyyy" (with percentage: 1-2 digit %, 1-3 digit days)
+    match = _RE_HESTRA_WITH_PERCENT.search(all_text)
+    if match:
+        result = f"{match.group(1)}% NET {match.group(2)}"
+        logger.debug(f"Found Hestra discount terms: {result}")
+        return result
 
-    # Hestra-specific format: "8%N90" -> "8% NET 90" or "N90" -> "NET 90"
-    if vendor_name == "Hestra Gloves, LLC":
-        # Look for pattern like "xx%Nyyy" (with percentage: 1-2 digit %, 1-3 digit days)
-        hestra_pattern_with_percent = r"(\d{1,2})%[nN](\d{1,3})\b"
-        match = re.search(hestra_pattern_with_percent, all_text)
-        if match:
-            result = f"{match.group(1)}% NET {match.group(2)}"
-            logger.debug(f"Found Hestra discount terms: {result}")
-            return result
+    # Look for pattern like "Nyyy" (without percentage: 1-3 digit days)
+    match = _RE_HESTRA_NO_PERCENT.search(all_text)
+    if match:
+        result = f"NET {match.group(1)}"
+        logger.debug(f"Found Hestra discount terms: {result}")
+        return result
 
-        # Look for pattern like "Nyyy" (without percentage: 1-3 digit days)
-        hestra_pattern_no_percent = r"\b[nN](\d{1,3})\b"
-        match = re.search(hestra_pattern_no_percent, all_text)
+def _big_adventures_terms(words, all_text, vendor_name):
+    """BIG Adventures: add "DISCOUNT OF X%" to the terms if they have no percentage."""
+    # First get standard discount terms using normal extraction
+    standard_result = None
+    for pattern in _BIG_ADVENTURES_PATTERNS:
+        match = pattern.search(all_text)
         if match:
-            result = f"NET {match.group(1)}"
-            logger.debug(f"Found Hestra discount terms: {result}")
+            standard_result = _tidy_terms(match.group())
+            break
+
+    # If we found terms, check if they already have a percentage
+    if standard_result and "%" not in standard_result:
+        # Look for "DISCOUNT OF X%, $XX.XX" pattern (handle OCR artifacts like CID:XX)
+        special_match = _RE_BIG_ADVENTURES_DISCOUNT.search(all_text)
+        if special_match:
+            discount_percent = special_match.group(1)
+            result = f"{discount_percent}% {standard_result}"
+            # logger.debug(f" Found BIG Adventures Combined Terms: {result}")
             return result
 
-    # BIG Adventures-specific: Add "DISCOUNT OF X%" to terms if no percentage already exists
-    if vendor_name == "BIG Adventures, LLC":
-        # First get standard discount terms using normal extraction
-        standard_result = None
-        for pattern in [
-            r"\b\d{1,2}%\s*NET\s*\d{1,3}\b",                # x% NET xx
-            r"\b\d{1,2}%\s*\d{1,2},?\s*NET\s*\d{1,3}\b",    # x% xx NET xx
-            r"\bNET\s*\d{1,3}\b",                           # NET xx
-        ]:
-            match = re.search(pattern, all_text)
-            if match:
-                value = match.group()
-                value = value.replace(",", " ")
-                value = re.sub(r'%(?=\d)', '% ', value)
-                value = re.sub(r'(?<=\d)(?=[A-Z])|(?<=[A-Z])(?=\d)', ' ', value)
-                value = re.sub(r"\s+", " ", value).strip()
-                standard_result = value
+    # Return standard result if found (with or without percentage)
+    if standard_result:
+        # logger.debug(f" Found BIG Adventures Standard Terms: {standard_result}")
+        return standard_result
+
+# Vendor-specific formats, dispatched by vendor name. Each handler takes
+# (words, all_text, vendor_name) and returns the terms or None.
+_VENDOR_PRE_HANDLERS = {
+    "Tite Line Fishing Products LLC": _tite_line_terms,
+    "Sherpa": _sherpa_terms,
+    "Blundstone": _blundstone_terms,
+    "Patagonia": _due_date_terms,
+    "Soto": _due_date_terms,
+    "Seirus Innovation": _seirus_terms,
+}
+
+_VENDOR_HANDLERS = {
+    "Rumpl": _rumpl_terms,
+    "Fishpond": _fishpond_terms,
+    "Oboz Footwear LLC": _oboz_terms,
+    "Sea to Summit": _sea_to_summit_terms,
+    "Camp USA": _camp_usa_terms,
+    "Hestra Gloves, LLC": _hestra_terms,
+    "BIG Adventures, LLC": _big_adventures_terms,
+}
+
+def _parse_mdy(text, pattern):
+    """Parse a date like datetime.strptime with "%m/%d/%y" / "%m/%d/%Y" (as a date)."""
+    match = pattern.fullmatch(text)
+    if not match:
+        raise ValueError(f"time data {text!r} does not match format")
+    month, day, year = match.groups()
+    if len(year) == 2:
+        # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+        year = int(year) + (1900 if int(year) >= 69 else 2000)
+    return date(int(year), int(month), int(day))
+
+def _tidy_terms(value):
+    """Normalize the spacing of a matched terms value (e.g. "2%10,NET30" -> "2% 10 NET 30")."""
+    # Remove commas, space out "%10" and digit/letter boundaries (but not %)
+    value = _RE_TERMS_SPACING.sub(' ', value)
+    # Clean up multiple spaces (str.split() trims and splits on the same
+    # whitespace as a \s+ regex, without a regex pass)
+    return " ".join(value.split())
+
+def _scan_terms(all_text):
+    """Find the lowest-ranked terms rule matching all_text; returns (match, rank)."""
+    if all_text.isascii():
+        pattern, text = _RE_TERMS_ASCII, all_text.encode("ascii")
+    else:
+        pattern, text = _RE_TERMS, all_text
+    best = None
+    best_rank = _NO_MATCH_RANK
+    for match in pattern.finditer(text):
+        rank = _TERMS_RANK[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 1:
                 break
+    if best is not None and pattern is _RE_TERMS_ASCII:
+        # Callers read str groups - re-match the winner on the text itself
+        best = _RE_TERMS.match(all_text, best.start())
+    return best, best_rank
 
-        # Look for "DISCOUNT OF X%, $XX.XX" pattern (handle OCR artifacts like CID:XX)
-        discount_pattern = r"DISCOUNT\s+OF\s+(\d{1,2})%,\s*(?:\(CID:\d+\))?\s*\$?[\d,]+\.?\d*"
-        special_match = re.search(discount_pattern, all_text)
-
-        # If we found terms, check if they already have a percentage
-        if standard_result and "%" not in standard_result:
-            if special_match:
-                discount_percent = special_match.group(1)
-                result = f"{discount_percent}% {standard_result}"
-                # logger.debug(f" Found BIG Adventures Combined Terms: {result}")
-                return result
-
-        # Return standard result if found (with or without percentage)
-        if standard_result:
-            # logger.debug(f" Found BIG Adventures Standard Terms: {standard_result}")
-            return standard_result
-
-    # Existing patterns
-    patterns = [
-        r"\b\d{1,2}%\s*\d{1,3},?\s*[nN]\d{1,3}\b",      # x% xx, nxxx or xx% xxx nxxx (lowercase n variant)
-        r"\b\d{1,2}%\s*[nN]\d{1,3}\b",                  # x%Nxx or x% nxx (e.g., 8%N45)
-        r"\b\d{1,2}%\s*NET\s*\d{1,3}\b",                # x% NET xx or xx% NET xx
-        r"\b\d{1,2}%\s*\d{1,2},?\s*NET\s*\d{1,3}\b",    # x% xx NET xx or xx% xx NET xx
-        r"\bNET\s*\d{1,3}\b",                           # NET xx or NET xxx
-        r"\bNET\s+DUE\s+IN\s+(\d{1,3})\b",              # NET DUE IN xx
-        r"\b\d{1,2}%\s*\d{1,2}\s*NET EOFM\b",           # x% xx NET EOFM or xx% xx NET EOFM (Fulling Mill)
-        r"\b\d{4}NET\d{2,3}\b",                         # xxxxNETxx or xxxxNETxxx (10% 60 NET 61 = 1060NET61)
-        r"\b\d{3}NET\d{2}\b"                            # xxxNETxx (single digit % like 1% 60 NET 61 = 160NET61)
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, all_text)
-        if match:
-            value = match.group()
-
-            # Skip if this is part of a product description (e.g., "MOSQUITO NET")
-            match_start = match.start()
-            match_end = match.end()
-            context_start = max(0, match_start - 20)
-            context_end = min(len(all_text), match_end + 20)
-            context = all_text[context_start:context_end]
-            if "MOSQUITO" in context:
-                continue
-            # Liberty Mountain Sports: insert % and spaces for no-space format
-            if vendor_name == "Liberty Mountain Sports":
-                # Handle 4-digit format: 1060NET61 -> 10% 60 NET 61
-                if re.match(r"\b\d{4}NET\d{2,3}\b", value):
-                    digits = re.match(r"(\d{2})(\d{2})NET(\d{2,3})", value)
-                    if digits:
-                        value = f"{digits.group(1)}% {digits.group(2)} NET {digits.group(3)}"
-                # Handle 3-digit format: 160NET61 -> 1% 60 NET 61
-                elif re.match(r"\b\d{3}NET\d{2}\b", value):
-                    digits = re.match(r"(\d)(\d{2})NET(\d{2})", value)
-                    if digits:
-                        value = f"{digits.group(1)}% {digits.group(2)} NET {digits.group(3)}"
-            # Normalize lowercase 'n' to uppercase 'NET' (e.g., "9% 90, n105" -> "9% 90, NET105")
-            value = re.sub(r'\b([nN])(\d)', r'NET\2', value)
-            # Remove commas and standardize spaces
-            value = value.replace(",", " ")
-            # Insert space after % if followed by digit
-            value = re.sub(r'%(?=\d)', '% ', value)
-            # Insert space between digit and letter boundaries (but not %)
-            value = re.sub(r'(?<=\d)(?=[A-Z])|(?<=[A-Z])(?=\d)', ' ', value)
-            # Clean up multiple spaces
-            value = re.sub(r"\s+", " ", value).strip()
-            if "DUE IN" in value:
-                net_days = match.group(1)
-                result = f"NET {net_days}"
-                logger.debug(f"Found Discount Terms: {result}")
-                return result
-            # logger.debug(f" Found Discount Terms: {value}")
-            return value
-
-    # Gear Aid default: if no terms found, default to NET 60
-    if vendor_name == "Gear Aid":
-        return "NET 60"
-    
-    # Scout Curated Wears default: if no terms found, default to NET 30
-    if vendor_name == "Scout Curated Wears":
-        return "NET 30"
-    
-    # Turtlebox Audio LLC default: if no terms found, default to NET 30
-    if vendor_name == "Turtlebox Audio LLC":
-        return "NET 30"
-
-    # Chaos Headwear, Nocqua, and K'Lani default: if no terms found, default to DUE TODAY
-    if vendor_name in ["Chaos Headwear", "Nocqua", "K'Lani LLC"]:
-        return "DUE TODAY"
-
-    return ""
+def _special_case_terms(match):
+    """Normalize the terms matched by special-case rules 1-6."""
+    # 4. "NET 120, 75 10%" -> "10% 75 NET 120"
+    if match.lastgroup == "net_comma":
+        return f"{match['net_comma_pct']}% {match['net_comma_second']} NET {match['net_comma_net']}"
+    # Every other rule -> "NET xx"
+    return f"NET {match[match.lastgroup + '_n']}"
 
 def _extract_rumpl_memo_percentage(words):
     """Extract percentage value that appears next to 'Memo' label at same Y-coordinate for Rumpl."""
     if not words:
         return None
 
-    # Find "Memo" labels
-    memo_positions = []
+    # Find "Memo" labels, and the words containing a percentage (in one pass,
+    # so each label below is only compared against the few percentage words)
+    memo_words = []
+    percent_words = []
     for word in words:
-        if word["text"].lower() == "memo":
-            memo_positions.append({
-                "x0": word["x0"],
-                "x1": word["x1"],
-                "top": word["top"],
-                "page_num": word.get("page_num", 0)
-            })
+        text = word["text"]
+        if text.lower() == "memo":
+            memo_words.append(word)
+        elif "%" in text:
+            percent_words.append(word)
 
     # Find percentages at same Y-coordinate to the right of memo labels
-    for memo_pos in memo_positions:
-        memo_page = memo_pos.get("page_num", 0)
+    for memo in memo_words:
+        memo_page = memo.get("page_num", 0)
+        memo_top = memo["top"]
+        memo_x1 = memo["x1"]
 
-        for word in words:
+        for word in percent_words:
             word_page = word.get("page_num", 0)
 
             # Skip if on different pages
             if memo_page != word_page:
                 continue
 
-            # Check if this word contains a percentage
-            if "%" in word["text"]:
-                # Check if it's at the same Y-coordinate (within 5px) and to the right
-                vertical_alignment = abs(word["top"] - memo_pos["top"])
-                horizontal_distance = word["x0"] - memo_pos["x1"]
+            # Check if it's at the same Y-coordinate (within 5px) and to the right
+            vertical_alignment = abs(word["top"] - memo_top)
+            horizontal_distance = word["x0"] - memo_x1
 
-                if (vertical_alignment <= 5 and          # Same Y-coordinate (±5px)
-                    0 <= horizontal_distance <= 300):   # To the right within 300px
+            if (vertical_alignment <= 5 and          # Same Y-coordinate (±5px)
+                0 <= horizontal_distance <= 300):   # To the right within 300px
 
-                    # Extract just the percentage (e.g., "7%" from "7%")
-                    percentage_match = re.search(r"(\d{1,2})%", word["text"])
-                    if percentage_match:
-                        return f"{percentage_match.group(1)}%"
+                # Extract just the percentage (e.g., "7%" from "7%")
+                percentage_match = _RE_PERCENTAGE.search(word["text"])
+                if percentage_match:
+                    return f"{percentage_match.group(1)}%"
 
     return None
\ No newline at end of file
@@ -1,6 +1,37 @@
 """
 Helper functions for detecting if a PDF was generated from an email.
 """
+import re
+
+from .common_extraction import joined_text
+
+# Very specific email client indicators (must appear at start of document)
+_EMAIL_CLIENT_INDICATORS = (
+    "outlook",           # Outlook email client
+    "gmail",             # Gmail
+    "thunderbird",       # Thunderbird
+    "apple mail",        # Apple Mail
+    "yahoo mail",        # Yahoo Mail
+)
+
+# Email header patterns that are very specific to email format
+_EMAIL_HEADER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bfrom\s+[^<]*<[^>]+@[^>]+>',     # "From Name <email@domain.com>"
+    r'\bto\s+[^<]*<[^>]+@[^>]+>',       # "To Name <email@domain.com>"
+    r'\bsent:\s+\w+\s+\d+/\d+/\d+',     # "Sent: Wed 8/27/2025"
+    r'\bdate\s+\w+\s+\d+/\d+/\d+\s+\d+:\d+',  # "Date Wed 8/27/2025 10:00"
+))
+
+# Very specific email forwarding patterns, as one alternation
+_FORWARDING_PATTERN = re.compile(
+    r'forwarded message|original message|begin forwarded message', re.IGNORECASE
+)
+
+# Email context fields
+_EMAIL_ADDRESS_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_FROM_PATTERN = re.compile(r'from\s+[^<]*<([^>]+)>', re.IGNORECASE)
+_TO_PATTERN = re.compile(r'to\s+[^<]*<([^>]+)>', re.IGNORECASE)
+
 
 def is_email_format(words):
     """
@@ -16,47 +47,24 @@ def is_email_format(words):
         return False
     
     # Create text blob for analysis (only check first 500 characters for efficiency)
-    raw_text = " ".join([w["text"] for w in words])[:500]
+    raw_text = joined_text(words)[:500]
     text_lower = raw_text.lower()
     
-    # Very specific email client indicators (must appear at start of document)
-    email_client_indicators = [
-        "outlook",           # Outlook email client
-        "gmail",             # Gmail
-        "thunderbird",       # Thunderbird
-        "apple mail",        # Apple Mail
-        "yahoo mail",        # Yahoo Mail
-    ]
-    
-    # Email header patterns that are very specific to email format
-    email_header_patterns = [
-        r'\bfrom\s+[^<]*<[^>]+@[^>]+>',     # "From Name <email@domain.com>"
-        r'\bto\s+[^<]*<[^>]+@[^>]+>',       # "To Name <email@domain.com>"
-        r'\bsent:\s+\w+\s+\d+/\d+/\d+',     # "Sent: Wed 8/27/2025"
-        r'\bdate\s+\w+\s+\d+/\d+/\d+\s+\d+:\d+',  # "Date Wed 8/27/2025 10:00"
-    ]
-    
-    import re
-    
-    # Check for email client at beginning of document
-    has_email_client = any(indicator in text_lower[:50] for indicator in email_client_indicators)
-    
-    # Check for email header patterns
-    header_pattern_count = sum(1 for pattern in email_header_patterns 
-                              if re.search(pattern, text_lower, re.IGNORECASE))
+    # Check for email client at beginning of document (anywhere in the first
+    # 50 characters - e.g. "Microsoft Outlook" - so not just a prefix test)
+    text_start = text_lower[:50]
+    has_email_client = any(indicator in text_start for indicator in _EMAIL_CLIENT_INDICATORS)
     
     # Must have email client AND at least 2 header patterns for high confidence
-    if has_email_client and header_pattern_count >= 2:
-        return True
+    # (the header patterns are only searched when there is an email client)
+    if has_email_client:
+        header_pattern_count = sum(1 for pattern in _EMAIL_HEADER_PATTERNS
+                                  if pattern.search(text_lower))
+        if header_pattern_count >= 2:
+            return True
     
     # Alternative: Look for very specific email forwarding pattern
-    forwarding_patterns = [
-        r'forwarded message',
-        r'original message',
-        r'begin forwarded message',
-    ]
-    
-    if any(re.search(pattern, text_lower, re.IGNORECASE) for pattern in forwarding_patterns):
+    if _FORWARDING_PATTERN.search(text_lower):
         return True
     
     return False
@@ -75,24 +83,21 @@ def get_email_context_info(words):
     if not words:
         return {}
     
-    raw_text = " ".join([w["text"] for w in words])
+    raw_text = joined_text(words)
     context = {}
     
-    import re
-    
     # Extract email addresses
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, raw_text)
+    emails = _EMAIL_ADDRESS_PATTERN.findall(raw_text)
     if emails:
         context['email_addresses'] = emails
     
     # Extract From field
-    from_match = re.search(r'from\s+[^<]*<([^>]+)>', raw_text, re.IGNORECASE)
+    from_match = _FROM_PATTERN.search(raw_text)
     if from_match:
         context['from_email'] = from_match.group(1)
     
     # Extract To field  
-    to_match = re.search(r'to\s+[^<]*<([^>]+)>', raw_text, re.IGNORECASE)
+    to_match = _TO_PATTERN.search(raw_text)
     if to_match:
         context['to_email'] = to_match.group(1)
     
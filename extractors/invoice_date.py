@@ -1,36 +1,81 @@
+import logging
 import re
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from itertools import accumulate
+from .common_extraction import joined_text
 from .utils import try_parse_date
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
-def extract_invoice_date(words, vendor_name):
+_MONTH_NAMES = [
+    "Jan(?:uary)?", "Feb(?:ruary)?", "Mar(?:ch)?", "Apr(?:il)?", "May", "Jun(?:e)?",
+    "Jul(?:y)?", "Aug(?:ust)?", "Sep(?:t(?:ember)?)?", "Oct(?:ober)?",
+    "Nov(?:ember)?", "Dec(?:ember)?"
+]
+
+_MONTH_ALTERNATION = "|".join(_MONTH_NAMES)
+
+_DATE_PATTERNS = [
+    r"\b(?:0?[1-9]|1[0-2])[/-](?:0?[1-9]|[12][0-9]|3[01])[/-](?:\d{2}|\d{4})\b",
+    r"\b\d{4}[-](?:0?[1-9]|1[0-2])[-](?:0?[1-9]|3[01])\b",
+    r"\b(?:{month})\s*\d{{1,2}},?\s*\d{{2,4}}\b".format(month=_MONTH_ALTERNATION),
+    r"\b\d{{1,2}}\s+(?:{month}),?\s+\d{{2,4}}\b".format(month=_MONTH_ALTERNATION),
+    r"\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:{month})\s+\d{{2,4}}\b".format(month=_MONTH_ALTERNATION),
+    r"\b(?:0?[1-9]|[12][0-9]|3[01])[-](?:{month})[-](?:\d{{2}}|\d{{4}})\b".format(month=_MONTH_ALTERNATION)
+]
+# Compiled once at import; used for both the blob scan and the per-word scan
+_DATE_RE = re.compile("|".join(_DATE_PATTERNS), re.IGNORECASE)
+_NUMERIC_DASH_DATE_RE = re.compile(r'^\d{1,2}-\d{1,2}-\d{2,4}$')
+
+# Vendor-specific date formats
+_SLASH_DATE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+# Carve Designs email dates followed by a time; the "date" group is the date portion
+_TIMESTAMP_RES = [
+    re.compile(r'(?P<date>\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\s+\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM)?', re.IGNORECASE),  # MM/DD/YY HH:MM or HH:MM AM/PM
+    re.compile(r'(?P<date>\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\s+at\s+\d{1,2}:\d{2}', re.IGNORECASE),  # MM/DD/YY at HH:MM
+    re.compile(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(?P<date>\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\s+\d{1,2}:\d{2}', re.IGNORECASE)  # Day MM/DD/YY HH:MM
+]
+# Vendors whose invoice date is the top-most or left-most valid date:
+# vendor -> (word coordinate, description)
+_EXTREME_DATE_VENDORS = {
+    "Lifestraw": ("top", "top-most"),
+    "Nite Ize Inc": ("top", "top-most"),
+    "Salomon": ("x0", "left-most"),
+}
+# Words near a timestamp date that mark it as a time
+_TIME_INDICATORS = ("AM", "PM", ":", "AT", "MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+_ARCTERYX_SEPTEMBER_RE = re.compile(r'September\s+(\d{1,2}),?\s+(?:202|20)(?:\d)?', re.IGNORECASE)
+_YYYY_MM_DD_RE = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
+_MONTH_DAY_YEAR_RE = re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})\b', re.IGNORECASE)
+_DOTTED_DATE_RE = re.compile(r'\b(\d{1,2})\.(\d{1,2})\.(\d{2})\b')
+
+def extract_invoice_date(words, vendor_name, text_blob=None):
+    # text_blob may be passed in by extract_fields, which joins each document once
+    if text_blob is None:
+        text_blob = joined_text(words)
+
+    # Dates are valid from the start of the month 480 days back through today
+    # (computed once here for every branch below)
+    today = datetime.today().date()
+    MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
+
     # Carve Designs-specific logic: for email format, skip dates with timestamps
     if vendor_name == "Carve Designs":
         from .email_detection import is_email_format
         
         if is_email_format(words):
             # Filter out dates that are followed by timestamps (email dates)
-            text_blob = " ".join([w["text"] for w in words])
-            
-            # Create a list to store dates with timestamps to exclude
-            timestamp_dates = []
+            # Create a set of the distinct dates with timestamps to exclude
+            timestamp_dates = set()
             
             # Look for dates followed by time patterns
-            timestamp_patterns = [
-                r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM)?',  # MM/DD/YY HH:MM or HH:MM AM/PM
-                r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+at\s+\d{1,2}:\d{2}',  # MM/DD/YY at HH:MM
-                r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}'  # Day MM/DD/YY HH:MM
-            ]
-            
-            for pattern in timestamp_patterns:
-                matches = re.finditer(pattern, text_blob, flags=re.IGNORECASE)
+            for pattern in _TIMESTAMP_RES:
+                matches = pattern.finditer(text_blob)
                 for match in matches:
                     # Extract just the date portion from the timestamp match
-                    date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', match.group(0))
-                    if date_match:
-                        timestamp_dates.append(date_match.group(0))
+                    timestamp_dates.add(match.group("date"))
             
             # Filter out words that are part of timestamp contexts, not just contain timestamp dates
             if timestamp_dates:
@@ -52,8 +97,7 @@ def extract_invoice_date(words, vendor_name):
                             nearby_text = words[j]["text"].upper()
                             
                             # Check if nearby words indicate this is a timestamp
-                            time_indicators = ["AM", "PM", ":", "AT", "MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
-                            if any(indicator in nearby_text for indicator in time_indicators):
+                            if any(indicator in nearby_text for indicator in _TIME_INDICATORS):
                                 # Additional check: make sure it's not just ":" from "Invoice Date:"
                                 if ":" in nearby_text and ("DATE" in nearby_text or "INVOICE" in nearby_text):
                                     continue  # This is likely "Invoice Date:", not a timestamp
@@ -68,14 +112,12 @@ def extract_invoice_date(words, vendor_name):
                 
                 # Use filtered words for date extraction
                 words = filtered_words
+                text_blob = " ".join([w["text"] for w in words])
     
     # Arc'teryx-specific logic: handle incomplete "September 10, 202" dates  
     if vendor_name == "Arc'teryx":
-        text_blob = " ".join([w["text"] for w in words])
-        
         # Look for incomplete September dates that need reconstruction
-        sep_pattern = r'September\s+(\d{1,2}),?\s+(?:202|20)(?:\d)?'
-        sep_match = re.search(sep_pattern, text_blob, re.IGNORECASE)
+        sep_match = _ARCTERYX_SEPTEMBER_RE.search(text_blob)
         
         if sep_match:
             # Extract the day number
@@ -91,113 +133,31 @@ def extract_invoice_date(words, vendor_name):
             parsed_date = try_parse_date(reconstructed_date)
             
             if parsed_date:
-                today = datetime.today().date()
-                MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
-                
                 if MIN_VALID_DATE <= parsed_date <= today:
-                    logger.debug(f"Arc'teryx: Reconstructed '{sep_match.group(0)}' as {reconstructed_date}")
+                    logger.debug("Arc'teryx: Reconstructed '%s' as %s", sep_match.group(0), reconstructed_date)
                     return reconstructed_date
     
-    # Lifestraw-specific logic: use top-most date (consistent format)
-    if vendor_name == "Lifestraw":
-        # Find all valid dates and use the top-most one
-        text_blob = " ".join([w["text"] for w in words])
-        
-        # Find all dates in the document
-        date_candidates = []
-        date_pattern = r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
-        
-        for word in words:
-            date_match = re.search(date_pattern, word["text"])
-            if date_match:
-                date_text = date_match.group(0)
-                parsed_date = try_parse_date(date_text)
-                if parsed_date:
-                    today = datetime.today().date()
-                    MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
-                    if MIN_VALID_DATE <= parsed_date <= today:
-                        date_candidates.append({
-                            "date": parsed_date,
-                            "y": word["top"],
-                            "text": date_text
-                        })
-        
-        if date_candidates:
-            # Sort by Y coordinate (top to bottom) and use the top-most
-            date_candidates.sort(key=lambda x: x["y"])
-            top_date = date_candidates[0]
-            logger.debug(f"Lifestraw: Using top-most date '{top_date['text']}'")
-            return top_date["date"].strftime("%m/%d/%y")
-    
-    # Nite Ize Inc-specific logic: use top-most date (consistent format)
-    if vendor_name == "Nite Ize Inc":
-        # Find all valid dates and use the top-most one
-        date_candidates = []
-        date_pattern = r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
-        
-        for word in words:
-            date_match = re.search(date_pattern, word["text"])
-            if date_match:
-                date_text = date_match.group(0)
-                parsed_date = try_parse_date(date_text)
-                if parsed_date:
-                    today = datetime.today().date()
-                    MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
-                    if MIN_VALID_DATE <= parsed_date <= today:
-                        date_candidates.append({
-                            "date": parsed_date,
-                            "y": word["top"],
-                            "text": date_text
-                        })
-        
-        if date_candidates:
-            # Sort by Y coordinate (top to bottom) and use the top-most
-            date_candidates.sort(key=lambda x: x["y"])
-            top_date = date_candidates[0]
-            logger.debug(f"Nite Ize Inc: Using top-most date '{top_date['text']}'")
-            return top_date["date"].strftime("%m/%d/%y")
-    
-    # Salomon-specific logic: use left-most date (consistent format)
-    if vendor_name == "Salomon":
-        # Find all valid dates and use the left-most one
-        date_candidates = []
-        date_pattern = r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
-        
-        for word in words:
-            date_match = re.search(date_pattern, word["text"])
-            if date_match:
-                date_text = date_match.group(0)
-                parsed_date = try_parse_date(date_text)
-                if parsed_date:
-                    today = datetime.today().date()
-                    MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
-                    if MIN_VALID_DATE <= parsed_date <= today:
-                        date_candidates.append({
-                            "date": parsed_date,
-                            "x": word["x0"],
-                            "text": date_text
-                        })
-        
-        if date_candidates:
-            # Sort by X coordinate (left to right) and use the left-most
-            date_candidates.sort(key=lambda x: x["x"])
-            left_date = date_candidates[0]
-            logger.debug(f"Salomon: Using left-most date '{left_date['text']}'")
-            return left_date["date"].strftime("%m/%d/%y")
+    # Lifestraw, Nite Ize Inc and Salomon: use the top-most or left-most
+    # date (consistent format)
+    extreme_date = _EXTREME_DATE_VENDORS.get(vendor_name)
+    if extreme_date:
+        coordinate, description = extreme_date
+        picked = _pick_extreme_date(words, coordinate, today, MIN_VALID_DATE)
+        if picked:
+            parsed_date, date_text = picked
+            logger.debug("%s: Using %s date '%s'", vendor_name, description, date_text)
+            return parsed_date.strftime("%m/%d/%y")
     
     # Saxx Underwear-specific logic: handle YYYY-MM-DD format
     if vendor_name == "Saxx Underwear":
         # Look for YYYY-MM-DD format and convert to standard format for normal processing
-        text_blob = " ".join([w["text"] for w in words])
-        
         # Find YYYY-MM-DD dates and add them as converted words
-        yyyy_mm_dd_pattern = r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b'
         converted_words = []
         
         for word in words:
             # Check if this word or nearby text contains YYYY-MM-DD format
             word_context = word["text"]
-            match = re.search(yyyy_mm_dd_pattern, word_context)
+            match = _YYYY_MM_DD_RE.search(word_context)
             if match:
                 year, month, day = match.groups()
                 # Convert to MM/DD/YY format
@@ -212,14 +172,12 @@ def extract_invoice_date(words, vendor_name):
         
         # Replace words with converted versions for normal processing
         words = converted_words
+        text_blob = " ".join([w["text"] for w in words])
 
     # Gentle Fawn-specific logic: handle month name dates that get missed by combined pattern
     if vendor_name == "Gentle Fawn":
-        text_blob = " ".join([w["text"] for w in words])
-
         # Look for Month DD, YYYY format specifically
-        month_pattern = r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})\b'
-        month_match = re.search(month_pattern, text_blob, re.IGNORECASE)
+        month_match = _MONTH_DAY_YEAR_RE.search(text_blob)
         if month_match:
             month_abbr, day, year = month_match.groups()
             # Convert month name to date and extract as MM/DD/YY
@@ -227,57 +185,37 @@ def extract_invoice_date(words, vendor_name):
             parsed_date = try_parse_date(full_date_str)
 
             if parsed_date:
-                today = datetime.today().date()
-                MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
                 if MIN_VALID_DATE <= parsed_date <= today:
                     return parsed_date.strftime("%m/%d/%y")
 
     # GSI Sports Products Inc-specific logic: handle MM.DD.YY format
     if vendor_name == "GSI Sports Products Inc":
-        text_blob = " ".join([w["text"] for w in words])
-
         # Look for MM.DD.YY format specifically
-        dot_pattern = r'\b(\d{1,2})\.(\d{1,2})\.(\d{2})\b'
-        dot_match = re.search(dot_pattern, text_blob)
+        dot_match = _DOTTED_DATE_RE.search(text_blob)
         if dot_match:
             month, day, year = dot_match.groups()
             converted_date = f"{month.zfill(2)}/{day.zfill(2)}/{year}"
             parsed_date = try_parse_date(converted_date)
 
             if parsed_date:
-                today = datetime.today().date()
-                MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
                 if MIN_VALID_DATE <= parsed_date <= today:
                     return converted_date
 
-    text_blob = " ".join([w["text"] for w in words])
-
-    MONTH_NAMES = [
-        "Jan(?:uary)?", "Feb(?:ruary)?", "Mar(?:ch)?", "Apr(?:il)?", "May", "Jun(?:e)?",
-        "Jul(?:y)?", "Aug(?:ust)?", "Sep(?:t(?:ember)?)?", "Oct(?:ober)?",
-        "Nov(?:ember)?", "Dec(?:ember)?"
-    ]
-
-    patterns = [
-        r"\b(?:0?[1-9]|1[0-2])[/-](?:0?[1-9]|[12][0-9]|3[01])[/-](?:\d{2}|\d{4})\b",
-        r"\b\d{4}[-](?:0?[1-9]|1[0-2])[-](?:0?[1-9]|3[01])\b",
-        r"\b(?:{month})\s*\d{{1,2}},?\s*\d{{2,4}}\b".format(month="|".join(MONTH_NAMES)),
-        r"\b\d{{1,2}}\s+(?:{month}),?\s+\d{{2,4}}\b".format(month="|".join(MONTH_NAMES)),
-        r"\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:{month})\s+\d{{2,4}}\b".format(month="|".join(MONTH_NAMES)),
-        r"\b(?:0?[1-9]|[12][0-9]|3[01])[-](?:{month})[-](?:\d{{2}}|\d{{4}})\b".format(month="|".join(MONTH_NAMES))
-    ]
-    combined_pattern = "|".join(patterns)
-    
     # Add a search on the combined text blob
+    # Checked once so the per-match and per-candidate loops below don't
+    # call into logging at all unless debug output is actually enabled
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     logger.debug("Searching in combined text blob")
-    text_blob_matches = re.finditer(combined_pattern, text_blob, flags=re.IGNORECASE)
-    blob_matches_found = False
+    # Scanned once; the matches are reused when processing them below
+    text_blob_matches = list(_DATE_RE.finditer(text_blob))
+    blob_matches_found = bool(text_blob_matches)
     
-    for match in text_blob_matches:
-        blob_matches_found = True
-        logger.debug(f"Found date in text blob: '{match.group(0)}'")
+    if debug_enabled:
+        for match in text_blob_matches:
+            logger.debug("Found date in text blob: '%s'", match.group(0))
     
-    #if not blob_matches_found:
+    if not blob_matches_found:
         logger.debug("No dates found in text blob either")
 
     # Find date strings with positions - NOW USING BLOB MATCHES
@@ -285,7 +223,7 @@ def extract_invoice_date(words, vendor_name):
 
     # First, try finding dates in individual words (as before)
     for w in words:
-        match = re.search(combined_pattern, w["text"], flags=re.IGNORECASE)
+        match = _DATE_RE.search(w["text"])
         if match:
             date_candidates.append({
                 "text": match.group(0),
@@ -297,12 +235,14 @@ def extract_invoice_date(words, vendor_name):
     # ALWAYS process blob matches, not just when date_candidates is empty
     if blob_matches_found:
         logger.debug("Processing text blob matches...")
-        text_blob_matches = re.finditer(combined_pattern, text_blob, flags=re.IGNORECASE)
+        word_mids = None
+        # Texts of the candidates so far, so each duplicate check is one lookup
+        candidate_texts = {dc["text"] for dc in date_candidates}
         
         for match in text_blob_matches:
             match_text = match.group(0)
             # Skip matches we already found in individual words
-            if any(dc["text"] == match_text for dc in date_candidates):
+            if match_text in candidate_texts:
                 #print(f"[DEBUG] Skipping duplicate blob match: '{match_text}'")
                 continue
                 
@@ -311,21 +251,11 @@ def extract_invoice_date(words, vendor_name):
             match_end_pos = match.end()
             
             # Find the word closest to this match by estimating position in text
-            char_count = 0
-            closest_word = words[0]
-            min_distance = float('inf')
-            
-            for w in words:
-                word_length = len(w["text"])
-                word_mid_point = char_count + word_length / 2
-                distance_to_match = abs(word_mid_point - (match_start_pos + match_end_pos) / 2)
-                
-                if distance_to_match < min_distance:
-                    min_distance = distance_to_match
-                    closest_word = w
-                
-                char_count += word_length + 1  # +1 for space
+            if word_mids is None:
+                word_mids = _word_midpoints(words)
+            closest_word = words[_closest_index(word_mids, (match_start_pos + match_end_pos) / 2)]
             
+            candidate_texts.add(match_text)
             date_candidates.append({
                 "text": match_text,
                 "x": closest_word["x0"],
@@ -339,19 +269,18 @@ def extract_invoice_date(words, vendor_name):
     #    print(f" - {dc['text']} at position ({dc['x']}, {dc['y']})")
 
     # Parse and validate dates (allowing 8 months in the past)
-    today = datetime.today().date()
-    MIN_VALID_DATE = (today - timedelta(days=480)).replace(day=1)
     valid_dates = []
     
     for candidate in date_candidates:
         raw_text = candidate["text"].strip().replace(",", "")
         # Only convert dashes to slashes for numeric dates, not month-name dates
-        if re.match(r'^\d{1,2}-\d{1,2}-\d{2,4}$', raw_text):
+        if _NUMERIC_DASH_DATE_RE.match(raw_text):
             raw_text = raw_text.replace("-", "/")
         parsed_date = try_parse_date(raw_text)
         
         if parsed_date:
-            logger.debug(f"Parsed date: {parsed_date}, Range check: {MIN_VALID_DATE} <= {parsed_date} <= {today}")
+            if debug_enabled:
+                logger.debug("Parsed date: %s, Range check: %s <= %s <= %s", parsed_date, MIN_VALID_DATE, parsed_date, today)
             if MIN_VALID_DATE <= parsed_date <= today:
                 valid_dates.append({
                     "date": parsed_date,
@@ -359,11 +288,12 @@ def extract_invoice_date(words, vendor_name):
                     "y": candidate["y"],
                     "word": candidate["word"]
                 })
-                logger.debug(f"OK Accepted valid date: {parsed_date} at position ({candidate['x']}, {candidate['y']})")
-            #else:
-                logger.debug(f"X Skipped date {parsed_date}, out of range")
-        #else:
-            logger.debug(f"X Could not parse: {raw_text}")
+                if debug_enabled:
+                    logger.debug("OK Accepted valid date: %s at position (%s, %s)", parsed_date, candidate["x"], candidate["y"])
+            elif debug_enabled:
+                logger.debug("X Skipped date %s, out of range", parsed_date)
+        elif debug_enabled:
+            logger.debug("X Could not parse: %s", raw_text)
     
     if not valid_dates:
         logger.debug("No valid dates found.")
@@ -373,61 +303,71 @@ def extract_invoice_date(words, vendor_name):
     labels = []
     excluded_terms = ["DUE", "SHIPPING", "ORDERED", "SHIP", "ORDER", "PAYMENT", "DISCOUNT"]
     
-    # FIRST PRIORITY: Look for exact "INVOICE DATE" or "CREDIT MEMO DATE" phrases
+    # One pass over the words finds both kinds of label below, upper-casing
+    # and cleaning each word's text once (the upper-cased texts are kept for
+    # the checks of the words before each DATE label)
+    invoice_date_labels = []
+    date_label_indexes = []
+    upper_texts = []
     for i, w in enumerate(words):
-        text = w["text"].upper().replace(":", "").strip()
-        if "INVOICE DATE" in text or "INV DATE" in text or "INV. DATE" in text or "CREDIT MEMO DATE" in text or "MEMO DATE" in text:
-            # Found an explicit invoice date label - this gets highest priority
-            #print(f"[DEBUG] Found explicit 'INVOICE DATE' or 'CREDIT MEMO DATE' label at ({w['x0']}, {w['top']})")
-            
-            # Find closest date to this label
-            best_date = find_closest_date(valid_dates, w["x0"], w["top"])
-            if best_date:
-                #print(f"[DEBUG] Selected date {best_date} based on proximity to explicit 'INVOICE DATE'")
-                return best_date.strftime("%m/%d/%y")
-            #else:
-                #print(f"[DEBUG] No valid date found near 'INVOICE DATE' label at ({w['x0']}, {w['top']})")
+        upper_text = w["text"].upper()
+        upper_texts.append(upper_text)
+        clean_text = upper_text.replace(":", "").strip()
+        if "INVOICE DATE" in clean_text or "INV DATE" in clean_text or "INV. DATE" in clean_text or "CREDIT MEMO DATE" in clean_text or "MEMO DATE" in clean_text:
+            invoice_date_labels.append(w)
+        elif clean_text == "DATE" or clean_text == "DT":
+            date_label_indexes.append(i)
+    
+    # FIRST PRIORITY: Look for exact "INVOICE DATE" or "CREDIT MEMO DATE" phrases
+    for w in invoice_date_labels:
+        # Found an explicit invoice date label - this gets highest priority
+        #print(f"[DEBUG] Found explicit 'INVOICE DATE' or 'CREDIT MEMO DATE' label at ({w['x0']}, {w['top']})")
+        
+        # Find closest date to this label
+        best_date = find_closest_date(valid_dates, w["x0"], w["top"])
+        if best_date:
+            #print(f"[DEBUG] Selected date {best_date} based on proximity to explicit 'INVOICE DATE'")
+            return best_date.strftime("%m/%d/%y")
+        #else:
+            #print(f"[DEBUG] No valid date found near 'INVOICE DATE' label at ({w['x0']}, {w['top']})")
 
     # SECOND PRIORITY: Collect ALL standalone "DATE" labels and use the top-most one
     date_labels = []
-    for i, w in enumerate(words):
-        text = w["text"].upper().strip()
-        clean_text = text.replace(":", "").strip()
-        if clean_text == "DATE" or clean_text == "DT":
-            #print(f"[DEBUG] Found potential 'DATE' label at ({w['x0']}, {w['top']})")
-            # Check if any excluded terms are nearby - ONLY CHECK BEFORE, not after
-            is_excluded = False
-            
-            for j in range(max(0, i-2), i):  # Only check words BEFORE
-                if abs(words[j]["top"] - w["top"]) < 15:
-                    nearby_text = words[j]["text"].upper()
-                    #print(f"[DEBUG] Checking nearby word BEFORE: '{nearby_text}', y-diff: {abs(words[j]['top'] - w['top'])}")
-                    if any(term in nearby_text for term in excluded_terms):
-                        is_excluded = True
-                        #print(f"[DEBUG] 'DATE' label excluded due to nearby term '{nearby_text}' containing excluded term")
-                        break
-                    
-                    # Special case: if the word right before is "INVOICE", this is an invoice date!
-                    if j == i-1 and ("INVOICE" in nearby_text or "INV" in nearby_text):
-                        #print(f"[DEBUG] Found 'INVOICE' right before 'DATE' - this is an invoice date!")
-                        best_date = find_closest_date(valid_dates, words[j]["x0"], words[j]["top"])
-                        if best_date:
-                            #print(f"[DEBUG] Selected date {best_date} based on 'INVOICE DATE' combination")
-                            return best_date.strftime("%m/%d/%y")
+    for i in date_label_indexes:
+        w = words[i]
+        #print(f"[DEBUG] Found potential 'DATE' label at ({w['x0']}, {w['top']})")
+        # Check if any excluded terms are nearby - ONLY CHECK BEFORE, not after
+        is_excluded = False
         
-            if not is_excluded:
-                #print(f"[DEBUG] Adding valid standalone 'DATE' label at ({w['x0']}, {w['top']})")
-                date_labels.append({
-                    "x": w["x0"],
-                    "y": w["top"],
-                    "word": w
-                })
+        for j in range(max(0, i-2), i):  # Only check words BEFORE
+            if abs(words[j]["top"] - w["top"]) < 15:
+                nearby_text = upper_texts[j]
+                #print(f"[DEBUG] Checking nearby word BEFORE: '{nearby_text}', y-diff: {abs(words[j]['top'] - w['top'])}")
+                if any(term in nearby_text for term in excluded_terms):
+                    is_excluded = True
+                    #print(f"[DEBUG] 'DATE' label excluded due to nearby term '{nearby_text}' containing excluded term")
+                    break
+                
+                # Special case: if the word right before is "INVOICE", this is an invoice date!
+                if j == i-1 and ("INVOICE" in nearby_text or "INV" in nearby_text):
+                    #print(f"[DEBUG] Found 'INVOICE' right before 'DATE' - this is an invoice date!")
+                    best_date = find_closest_date(valid_dates, words[j]["x0"], words[j]["top"])
+                    if best_date:
+                        #print(f"[DEBUG] Selected date {best_date} based on 'INVOICE DATE' combination")
+                        return best_date.strftime("%m/%d/%y")
+    
+        if not is_excluded:
+            #print(f"[DEBUG] Adding valid standalone 'DATE' label at ({w['x0']}, {w['top']})")
+            date_labels.append({
+                "x": w["x0"],
+                "y": w["top"],
+                "word": w
+            })
 
     # If we have standalone DATE labels, use the top-most one
     if date_labels:
-        # Sort by y-coordinate (top to bottom)
-        date_labels.sort(key=lambda x: x["y"])
-        top_label = date_labels[0]
+        # Smallest y-coordinate (the first one on ties)
+        top_label = min(date_labels, key=lambda x: x["y"])
         #print(f"[DEBUG] Using top-most 'DATE' label at ({top_label['x']}, {top_label['y']})")
         
         best_date = find_closest_date(valid_dates, top_label["x"], top_label["y"])
@@ -439,12 +379,49 @@ def extract_invoice_date(words, vendor_name):
     
     # FALLBACK: Use top-most date
     if valid_dates:
-        valid_dates.sort(key=lambda x: x["y"])
-        #print(f"[DEBUG] No suitable labels found. Using top-most date: {valid_dates[0]['date']}")
-        return valid_dates[0]["date"].strftime("%m/%d/%y")
+        top_date = min(valid_dates, key=lambda x: x["y"])
+        #print(f"[DEBUG] No suitable labels found. Using top-most date: {top_date['date']}")
+        return top_date["date"].strftime("%m/%d/%y")
     
     return ""
 
+def _pick_extreme_date(words, coordinate, today, min_valid_date):
+    """
+    Return (date, text) of the valid slash date in the word with the smallest
+    coordinate ("top" or "x0"), the first one on ties; None if there is none.
+    """
+    best = None
+    best_position = None
+    for word in words:
+        date_match = _SLASH_DATE_RE.search(word["text"])
+        if date_match:
+            date_text = date_match.group(0)
+            parsed_date = try_parse_date(date_text)
+            if parsed_date and min_valid_date <= parsed_date <= today:
+                position = word[coordinate]
+                if best is None or position < best_position:
+                    best = (parsed_date, date_text)
+                    best_position = position
+    return best
+
+def _word_midpoints(words):
+    """Character midpoint of each word within " ".join(word texts)."""
+    starts = accumulate((len(w["text"]) + 1 for w in words), initial=0)
+    return [start + len(w["text"]) / 2 for start, w in zip(starts, words)]
+
+def _closest_index(mids, target):
+    """
+    Index of the midpoint nearest target. mids is strictly increasing, so only
+    the two neighbours of the insertion point can be closest; ties go to the
+    earlier word.
+    """
+    i = bisect_left(mids, target)
+    if i == len(mids):
+        return i - 1
+    if i > 0 and target - mids[i - 1] <= mids[i] - target:
+        return i - 1
+    return i
+
 def find_closest_date(dates, label_x, label_y):
     """Find the date closest to a label position"""
     if not dates:
@@ -10,6 +10,33 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Invoice-number validation patterns (is_potential_invoice_number runs once
+# per candidate word, so these are compiled at import)
+_RE_PHONE = re.compile(r"^\d{3}-\d{3}-\d{4}$")
+_RE_HYDRO_FLASK = re.compile(r"^\d{5,}$")
+_VENDOR_PREFIX_PATTERNS = {
+    "Helinox": re.compile(r"^invus\d+$", re.IGNORECASE),              # "INVUS" followed by digits
+    "Outdoor Research": re.compile(r"^us\.si-\d+$", re.IGNORECASE),   # US.SI- followed by digits
+    "Oboz Footwear LLC": re.compile(r"^csi\d+$", re.IGNORECASE),       # "csi" followed by digits
+    "IceMule Company": re.compile(r"^inv-\d*$", re.IGNORECASE),        # starts with "inv-"
+    "Panache Apparel": re.compile(r"^panache-\d+$", re.IGNORECASE),    # "panache-" followed by digits
+    "Prana Living LLC": re.compile(r"^\d+$"),                          # digits only
+}
+_RE_GREGORY = re.compile(r"^#?(?:[a-zA-Z]{1,4}-?)?[0-9]{3,}[a-zA-Z0-9\-]*$", re.IGNORECASE)
+_VENDOR_LATE_PATTERNS = {
+    "Scientific Anglers LLC": re.compile(r"^i-sa-\d+$", re.IGNORECASE),  # "i-sa-" followed by digits
+    "KATIN": re.compile(r"^usa-i\d+$", re.IGNORECASE),                  # "usa-i" followed by digits
+    "Kavu": re.compile(r"^ipres\d+$", re.IGNORECASE),                   # "IPRES" followed by digits
+}
+_RE_GENERAL = re.compile(
+    r"^#?(?:[a-zA-Z]{1,4}-?)?[0-9]{2,}[a-zA-Z0-9\-\/]*$"  # original pattern
+    r"|^si\+\d{5,6}$",  # explicitly allow si-xxxxx or si-xxxxxx
+    re.IGNORECASE
+)
+# Vendor-specific invoice numbers found below their labels
+_RE_SALOMON = re.compile(r"^\d{5,}$")                                   # 5+ digits
+_RE_YAKIMA = re.compile(r"^[0-9]{2}[a-zA-Z]{2}[0-9]{7}$", re.IGNORECASE)  # "12AB1234567"
+
 def extract_invoice_number(words, vendor_name):
     """
     Extract invoice number from document
@@ -30,8 +57,8 @@ def extract_invoice_number(words, vendor_name):
             for i in range(len(normalized_words) - 1):
                 first = normalized_words[i]
                 second = normalized_words[i + 1]
-                if first["text"] == "credit" and second["text"] == "note":
-                    credit_note_positions.append((first["x0"], second["x1"], first["top"]))
+                if first.text == "credit" and second.text == "note":
+                    credit_note_positions.append((first.x0, second.x1, first.top))
             
             # Look below credit note labels specifically
             if credit_note_positions:
@@ -57,8 +84,8 @@ def extract_invoice_number(words, vendor_name):
     # Vendor-specific: Add "number" as a label for Oboz
     if vendor_name == "Oboz Footwear LLC":
         for idx, w in enumerate(normalized_words):
-            if w["text"] == "number":
-                label_positions.append((w["x0"], w["x1"], w["top"]))
+            if w.text == "number":
+                label_positions.append((w.x0, w.x1, w.top))
     
     # Darn Tough-specific logic: use only "Invoice ID" labels instead of "Invoice"
     if vendor_name == "Darn Tough":
@@ -67,8 +94,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "invoice" and second["text"] == "id":
-                invoice_id_positions.append((first["x0"], second["x1"], second["top"]))
+            if first.text == "invoice" and second.text == "id":
+                invoice_id_positions.append((first.x0, second.x1, second.top))
         
         # If we found Invoice ID labels, use them exclusively
         if invoice_id_positions:
@@ -146,8 +173,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "invoice" and second["text"] == "no":
-                hydro_flask_positions.append((first["x0"], second["x1"], first["top"]))
+            if first.text == "invoice" and second.text == "no":
+                hydro_flask_positions.append((first.x0, second.x1, first.top))
         
         # If we found "INVOICE NO" labels, search below them
         if hydro_flask_positions:
@@ -170,21 +197,21 @@ def extract_invoice_number(words, vendor_name):
 
         for label_idx, (label_x0, label_x1, label_y) in enumerate(label_positions):
             for w in normalized_words:
-                mid_x = (w["x0"] + w["x1"]) / 2
-                vertical_distance = w["top"] - label_y
+                mid_x = (w.x0 + w.x1) / 2
+                vertical_distance = w.top - label_y
 
                 # Add 10px buffer to the right edge of label
                 if (
                     label_x0 <= mid_x <= (label_x1 + 10) and
                     0 < vertical_distance <= 50 and
-                    is_potential_invoice_number(w["text"], vendor_name)
+                    is_potential_invoice_number(w.text, vendor_name)
                 ):
                     if vertical_distance < best_score:
                         best_score = vertical_distance
                         best_candidate = w
 
         if best_candidate:
-            return best_candidate["orig"].lstrip("#:").strip()
+            return best_candidate.orig.lstrip("#:").strip()
         return ""
 
     # Owala-specific logic: look for "Reference Nbr" pattern
@@ -194,8 +221,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "reference" and "nbr" in second["text"]:
-                owala_positions.append((first["x0"], second["x1"], second["top"]))
+            if first.text == "reference" and "nbr" in second.text:
+                owala_positions.append((first.x0, second.x1, second.top))
 
         # Search to the right of "Reference Nbr"
         if owala_positions:
@@ -216,8 +243,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "invoice" and second["text"] in ["no","no."]:
-                oregon_positions.append((first["x0"], second["x1"], first["top"]))
+            if first.text == "invoice" and second.text in ["no","no."]:
+                oregon_positions.append((first.x0, second.x1, first.top))
 
         # If we found "INVOICE NO" labels, search below them
         if oregon_positions:
@@ -244,8 +271,8 @@ def extract_invoice_number(words, vendor_name):
             for i in range(len(normalized_words) - 1):
                 first = normalized_words[i]
                 second = normalized_words[i + 1]
-                if first["text"] == "credit" and (second["text"] == "#" or (second["text"] == "" and second["orig"] == "#")):
-                    credit_positions.append((first["x0"], second["x1"], first["top"]))
+                if first.text == "credit" and (second.text == "#" or (second.text == "" and second.orig == "#")):
+                    credit_positions.append((first.x0, second.x1, first.top))
             
             # If we found "Credit #" labels, search to the right
             if credit_positions:
@@ -265,8 +292,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "transaction" and second["text"] == "number":
-                transaction_positions.append((first["x0"], second["x1"], first["top"]))
+            if first.text == "transaction" and second.text == "number":
+                transaction_positions.append((first.x0, second.x1, first.top))
         
         # If we found "Transaction Number" labels, search to the right
         if transaction_positions:
@@ -284,8 +311,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "order" and second["text"] == "number":
-                order_positions.append((first["x0"], second["x1"], first["top"]))
+            if first.text == "order" and second.text == "number":
+                order_positions.append((first.x0, second.x1, first.top))
         
         # If we found "Order Number" labels, search to the right
         if order_positions:
@@ -305,15 +332,14 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "invoice" and second["text"].startswith("no"):
-                salomon_positions.append((first["x0"], second["x1"], first["top"]))
+            if first.text == "invoice" and second.text.startswith("no"):
+                salomon_positions.append((first.x0, second.x1, first.top))
         
         # If we found "Invoice No." labels, search below them for 5+ digit strings
         if salomon_positions:
             def is_valid_salomon_number(text):
-                import re
                 # Accept any string of 5+ digits
-                return re.match(r'^\d{5,}$', text.strip()) is not None
+                return _RE_SALOMON.match(text.strip()) is not None
             
             salomon_result = find_value_below(
                 normalized_words,
@@ -331,8 +357,8 @@ def extract_invoice_number(words, vendor_name):
         for i in range(len(normalized_words) - 1):
             first = normalized_words[i]
             second = normalized_words[i + 1]
-            if first["text"] == "invoice" and second["text"].startswith("no"):
-                sea_to_summit_positions.append((first["x0"], second["x1"], first["top"]))
+            if first.text == "invoice" and second.text.startswith("no"):
+                sea_to_summit_positions.append((first.x0, second.x1, first.top))
         
         # If we found "Invoice No." labels, search to the right
         if sea_to_summit_positions:
@@ -423,28 +449,28 @@ def extract_invoice_number(words, vendor_name):
     for i in range(len(normalized_words) - 1):
         first = normalized_words[i]
         second = normalized_words[i + 1]
-        if (first["text"] == "credit" and second["text"] in ["memo", "note"]):
+        if (first.text == "credit" and second.text in ["memo", "note"]):
             # Combine their bounding boxes for the label position
-            label_positions.append((first["x0"], second["x1"], first["top"]))
+            label_positions.append((first.x0, second.x1, first.top))
     
     # Prana-specific logic: check under the label "Reference"
     if vendor_name == "Prana Living LLC":
         logger.debug("Checking for all 'reference' labels for Prana Living LLC")
         for idx, w in enumerate(normalized_words):
-            if w["text"] == "reference":
-                logger.debug(f"Reference label at index={idx}, x0={w['x0']}, x1={w['x1']}, top={w['top']}, bottom={w['bottom']}")
+            if w.text == "reference":
+                logger.debug("Reference label at index=%s, x0=%s, x1=%s, top=%s, bottom=%s", idx, w.x0, w.x1, w.top, w.bottom)
                 # Allow vertical overlap or small positive distance
                 candidates = [
                     cand for cand in normalized_words
-                    if (cand["x0"] >= w["x0"] - 100 and cand["x1"] <= w["x1"] + 100) and
-                       -5 <= (cand["top"] - w["bottom"]) <= 300 and
-                       is_potential_invoice_number(cand["text"], vendor_name)
+                    if (cand.x0 >= w.x0 - 100 and cand.x1 <= w.x1 + 100) and
+                       -5 <= (cand.top - w.bottom) <= 300 and
+                       is_potential_invoice_number(cand.text, vendor_name)
                 ]
-                logger.debug(f"Candidates found below 'reference': {[c['orig'] for c in candidates]}")
+                logger.debug("Candidates found below 'reference': %s", [c.orig for c in candidates])
                 if candidates:
-                    best = sorted(candidates, key=lambda x: abs(x["top"] - w["bottom"]))[0]
-                    logger.debug(f"Invoice Number (below 'Reference' for Prana): {best['orig']}")
-                    return best["orig"].lstrip("#:").strip()
+                    best = sorted(candidates, key=lambda x: abs(x.top - w.bottom))[0]
+                    logger.debug("Invoice Number (below 'Reference' for Prana): %s", best.orig)
+                    return best.orig.lstrip("#:").strip()
                 #else:
                     logger.debug("No valid invoice number found below this 'reference' label.")
     
@@ -452,27 +478,27 @@ def extract_invoice_number(words, vendor_name):
     if vendor_name == "Prism Designs":
         logger.debug("Checking for 'Invoice' label for Prism Designs")
         for idx, w in enumerate(normalized_words):
-            if w["text"] == "invoice":
+            if w.text == "invoice":
                 #print(f"[DEBUG] Found 'invoice' label at index={idx}, x0={w['x0']}, x1={w['x1']}, top={w['top']}, bottom={w['bottom']}")
                 # Look for values directly below this label with relaxed horizontal alignment
                 candidates = [
                     cand for cand in normalized_words
-                    if (cand["x0"] >= w["x0"] - 50 and cand["x1"] <= w["x1"] + 100) and
-                       5 <= (cand["top"] - w["bottom"]) <= 100 and
-                       is_potential_invoice_number(cand["text"], vendor_name)
+                    if (cand.x0 >= w.x0 - 50 and cand.x1 <= w.x1 + 100) and
+                       5 <= (cand.top - w.bottom) <= 100 and
+                       is_potential_invoice_number(cand.text, vendor_name)
                 ]
                 #print(f"[DEBUG] Candidates found below 'invoice': {[c['orig'] for c in candidates]}")
                 if candidates:
-                    best = sorted(candidates, key=lambda x: abs(x["top"] - w["bottom"]))[0]
+                    best = sorted(candidates, key=lambda x: abs(x.top - w.bottom))[0]
                     #print(f"[DEBUG] Invoice Number (below 'Invoice' for Prism Designs): {best['orig']}")
-                    return best["orig"].lstrip("#:").strip()
+                    return best.orig.lstrip("#:").strip()
     
     # Nite Ize Inc-specific logic: look for "Order Number" label
     if vendor_name == "Nite Ize Inc":
         #print("[DEBUG] Checking for 'Order Number' label for Nite Ize Inc")
         for idx, w in enumerate(normalized_words):
             # Look for "order" word followed by "number" word
-            if w["text"] == "order" and idx < len(normalized_words) - 1 and normalized_words[idx + 1]["text"] == "number":
+            if w.text == "order" and idx < len(normalized_words) - 1 and normalized_words[idx + 1].text == "number":
                 order_label = w
                 number_label = normalized_words[idx + 1]
                 #print(f"[DEBUG] Found 'Order Number' at index={idx}, x0={order_label['x0']}, x1={number_label['x1']}")
@@ -480,17 +506,17 @@ def extract_invoice_number(words, vendor_name):
                 # Look for values to the right of this label
                 candidates = [
                     cand for cand in normalized_words
-                    if (cand["x0"] > number_label["x1"]) and
-                       abs(cand["top"] - order_label["top"]) < 20 and
-                       is_potential_invoice_number(cand["text"], vendor_name)
+                    if (cand.x0 > number_label.x1) and
+                       abs(cand.top - order_label.top) < 20 and
+                       is_potential_invoice_number(cand.text, vendor_name)
                 ]
                 
                 #print(f"[DEBUG] Candidates found next to 'Order Number': {[c['orig'] for c in candidates]}")
                 if candidates:
                     # Get the closest candidate to the right
-                    best = sorted(candidates, key=lambda x: x["x0"] - number_label["x1"])[0]
+                    best = sorted(candidates, key=lambda x: x.x0 - number_label.x1)[0]
                     #print(f"[DEBUG] Invoice Number (from 'Order Number' for Nite Ize Inc): {best['orig']}")
-                    return best["orig"].lstrip("#:").strip()
+                    return best.orig.lstrip("#:").strip()
     
     # Arc'teryx-specific logic: prioritize looking below labels to avoid years like "2025"
     if vendor_name == "Arc'teryx":
@@ -502,15 +528,15 @@ def extract_invoice_number(words, vendor_name):
         # Step 1: Check below "Invoice" labels
         for label_idx, (label_x0, label_x1, label_y) in enumerate(label_positions):
             for w in normalized_words:
-                mid_x = (w["x0"] + w["x1"]) / 2
-                vertical_distance = w["top"] - label_y
+                mid_x = (w.x0 + w.x1) / 2
+                vertical_distance = w.top - label_y
                 
                 # Arc'teryx invoice numbers should be 10 digits, not 4-digit years
                 if (
                     label_x0 <= mid_x <= label_x1 and
                     0 < vertical_distance <= max_distance_below and
-                    is_potential_invoice_number(w["text"], vendor_name) and
-                    len(w["text"]) >= 10  # Exclude 4-digit years like "2025"
+                    is_potential_invoice_number(w.text, vendor_name) and
+                    len(w.text) >= 10  # Exclude 4-digit years like "2025"
                 ):
                     all_candidates.append({
                         'word': w,
@@ -523,25 +549,25 @@ def extract_invoice_number(words, vendor_name):
         # Step 2: Check below "Credit" labels (some Arc'teryx files have invoice number there)
         credit_label_positions = []
         for idx, w in enumerate(normalized_words):
-            if w["text"] == "credit":
+            if w.text == "credit":
                 # Check if followed by "note" to make "Credit Note"
-                if idx < len(normalized_words) - 1 and normalized_words[idx + 1]["text"] == "note":
+                if idx < len(normalized_words) - 1 and normalized_words[idx + 1].text == "note":
                     next_word = normalized_words[idx + 1]
-                    credit_label_positions.append((w["x0"], next_word["x1"], w["top"]))
+                    credit_label_positions.append((w.x0, next_word.x1, w.top))
                 else:
                     # Just "Credit" by itself
-                    credit_label_positions.append((w["x0"], w["x1"], w["top"]))
+                    credit_label_positions.append((w.x0, w.x1, w.top))
         
         for label_idx, (label_x0, label_x1, label_y) in enumerate(credit_label_positions):
             for w in normalized_words:
-                mid_x = (w["x0"] + w["x1"]) / 2
-                vertical_distance = w["top"] - label_y
+                mid_x = (w.x0 + w.x1) / 2
+                vertical_distance = w.top - label_y
                 
                 if (
                     label_x0 <= mid_x <= label_x1 and
                     0 < vertical_distance <= max_distance_below and
-                    is_potential_invoice_number(w["text"], vendor_name) and
-                    len(w["text"]) >= 10  # Exclude 4-digit years like "2025"
+                    is_potential_invoice_number(w.text, vendor_name) and
+                    len(w.text) >= 10  # Exclude 4-digit years like "2025"
                 ):
                     all_candidates.append({
                         'word': w,
@@ -556,8 +582,8 @@ def extract_invoice_number(words, vendor_name):
             # Count occurrences of each number in the document
             number_counts = {}
             for w in normalized_words:
-                if w["text"].isdigit() and len(w["text"]) >= 10:
-                    number_counts[w["text"]] = number_counts.get(w["text"], 0) + 1
+                if w.text.isdigit() and len(w.text) >= 10:
+                    number_counts[w.text] = number_counts.get(w.text, 0) + 1
             
             # Score candidates: prefer numbers that appear less frequently (more unique)
             # and are closer to their respective labels
@@ -565,7 +591,7 @@ def extract_invoice_number(words, vendor_name):
             best_score = float("inf")
             
             for candidate in all_candidates:
-                number = candidate['word']['text']
+                number = candidate['word'].text
                 frequency = number_counts.get(number, 1)
                 distance = candidate['distance']
                 
@@ -582,7 +608,7 @@ def extract_invoice_number(words, vendor_name):
             
             if best_candidate:
                 #print(f"[DEBUG] Invoice Number (Arc'teryx smart logic): {best_candidate['orig']}")
-                return best_candidate["orig"].lstrip("#:").strip()
+                return best_candidate.orig.lstrip("#:").strip()
     
     # Look for value to the right of any invoice label (strict)
     invoice_right_match = find_value_to_right(
@@ -611,17 +637,16 @@ def extract_invoice_number(words, vendor_name):
 
     for label_idx, (label_x0, label_x1, label_y) in enumerate(label_positions):
         for w in normalized_words:
-            mid_x = (w["x0"] + w["x1"]) / 2
-            vertical_distance = w["top"] - label_y
+            mid_x = (w.x0 + w.x1) / 2
+            vertical_distance = w.top - label_y
 
             # Yakima-specific regex
             if vendor_name == "Yakima":
-                yakima_regex = r"^[0-9]{2}[a-zA-Z]{2}[0-9]{7}$"
                 if (
                     label_x0 <= mid_x <= label_x1 and
                     0 < vertical_distance <= max_distance_below
                 ):
-                    match = re.match(yakima_regex, w["text"], re.IGNORECASE)
+                    match = _RE_YAKIMA.match(w.text)
                     if match:
                         #print(f"[DEBUG] Yakima candidate from label {label_idx}: {w['orig']} (Δy={vertical_distance:.1f})")
                         if vertical_distance < best_score:
@@ -632,7 +657,7 @@ def extract_invoice_number(words, vendor_name):
             elif (
                 label_x0 <= mid_x <= label_x1 and
                 0 < vertical_distance <= max_distance_below and
-                is_potential_invoice_number(w["text"], vendor_name)
+                is_potential_invoice_number(w.text, vendor_name)
             ):
                 #print(f"[DEBUG] Candidate from label {label_idx}: {w['orig']} (Δy={vertical_distance:.1f})")
                 if vertical_distance < best_score:
@@ -640,81 +665,40 @@ def extract_invoice_number(words, vendor_name):
                     best_candidate = w
 
     if best_candidate:
-        logger.debug(f"Invoice Number (below fallback best): {best_candidate['orig']}")
-        return best_candidate["orig"].lstrip("#:").strip()
+        logger.debug("Invoice Number (below fallback best): %s", best_candidate.orig)
+        return best_candidate.orig.lstrip("#:").strip()
 
     logger.debug("No label match or fallback for Invoice Number.")
     return ""
 
 def is_potential_invoice_number(text, vendor_name=None):
-    logger.debug(f"Testing invoice candidate: '{text}' for vendor '{vendor_name}'")
+    stripped = text.strip()
     # Hydro Flask: accept digit sequences but exclude phone patterns
     if vendor_name == "Hydro Flask":
         # Exclude phone number patterns
-        if re.match(r"^\d{3}-\d{3}-\d{4}$", text.strip()):
+        if _RE_PHONE.match(stripped):
             return False
         # Accept sequences of digits (let general validation handle the rest)
-        return re.match(r"^\d{5,}$", text.strip()) is not None
-    # Helinox: must start with "INVUS" followed by digits
-    if vendor_name == "Helinox":
-        return re.match(r"^invus\d+$", text.strip(), re.IGNORECASE) is not None
-    # Outdoor Research: match US.SI- followed by digits
-    if vendor_name == "Outdoor Research":
-        return re.match(r"^us\.si-\d+$", text.strip(), re.IGNORECASE) is not None
-    # Oboz: must start with "csi" followed by digits
-    if vendor_name == "Oboz Footwear LLC":
-        return re.match(r"^csi\d+$", text.strip(), re.IGNORECASE) is not None
-    # IceMule: must start with "inv"
-    if vendor_name == "IceMule Company":
-        return re.match(r"^inv-\d*$", text.strip(), re.IGNORECASE) is not None
-    # Panache: must start with "panache-" followed by 5 digits
-    if vendor_name == "Panache Apparel":
-        return re.match(r"^panache-\d+$", text.strip(), re.IGNORECASE) is not None
-    # Prana: only match a string of digits (no letters, slashes, or punctuation)
-    if vendor_name == "Prana Living LLC":
-        return re.match(r"^\d+$", text.strip()) is not None
+        return _RE_HYDRO_FLASK.match(stripped) is not None
+    # Vendors whose invoice numbers have a fixed prefix/shape (Helinox, Outdoor
+    # Research, Oboz, IceMule, Panache, Prana)
+    pattern = _VENDOR_PREFIX_PATTERNS.get(vendor_name)
+    if pattern is not None:
+        return pattern.match(stripped) is not None
     # Exclude any candidate starting with "XD-"
-    if text.strip().upper().startswith("XD-"):
+    if stripped.upper().startswith("XD-"):
         return False
     # Gregory: must be number larger than 2 digits
     if vendor_name == "Gregory Mountain Products" or vendor_name == "Treadlabs":
-        return re.match(
-            r"^#?(?:[a-zA-Z]{1,4}-?)?[0-9]{3,}[a-zA-Z0-9\-]*$",
-            text.strip(),
-            re.IGNORECASE
-        )
-    # Scientific Anglers LLC: must start with "i-sa-" followed by digits
-    if vendor_name == "Scientific Anglers LLC":
-        return re.match(r"^i-sa-\d+$", text.strip(), re.IGNORECASE) is not None
-    # Katin: must start with "usa-i" followed by digits
-    if vendor_name == "KATIN":
-        return re.match(r"^usa-i\d+$", text.strip(), re.IGNORECASE) is not None
-    # Kavu: must start with "IPRES" followed by digits
-    if vendor_name == "Kavu":
-        return re.match(r"^ipres\d+$", text.strip(), re.IGNORECASE) is not None
+        return _RE_GREGORY.match(stripped) is not None
+    # Vendors checked after the "XD-" exclusion (Scientific Anglers, Katin, Kavu)
+    pattern = _VENDOR_LATE_PATTERNS.get(vendor_name)
+    if pattern is not None:
+        return pattern.match(stripped) is not None
+    # Additional global check: invoice numbers must be at least 4 characters
+    # long. Checked first so most short words never reach the regex; every
+    # general match contains digits, so no separate digit check is needed.
+    if len(stripped) < 4:
+        return False
     # General case:
-    general_regex = (
-        r"^#?(?:[a-zA-Z]{1,4}-?)?[0-9]{2,}[a-zA-Z0-9\-\/]*$"  # original pattern
-        r"|^si\+\d{5,6}$"  # explicitly allow si-xxxxx or si-xxxxxx
-    )
-    matches_general = re.match(
-        general_regex,
-        text.strip(),
-        re.IGNORECASE
-    )
-
-    # Additional global check: invoice numbers must be at least 4 characters long
-    if matches_general:
-        stripped = text.strip()
-        # If only digits, must be at least 4 digits
-        if re.match(r"^\d+$", stripped):
-            return len(stripped) >= 4
-        # If alphanumeric, must be at least 4 characters AND contain at least one digit
-        elif re.search(r"[a-zA-Z]", stripped):
-            has_digit = re.search(r"\d", stripped)
-            return len(stripped) >= 4 and has_digit is not None
-        # Other formats (with special chars, etc.) - apply length check
-        else:
-            return len(stripped) >= 4
-
-    return bool(matches_general)
\ No newline at end of file
+    return _RE_GENERAL.match(stripped) is not None
\ No newline at end of file
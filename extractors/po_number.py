@@ -237,9 +237,9 @@ def filter_po_box_labels(po_label_positions, normalized_words):
     for idx, (x0, x1, y) in enumerate(po_label_positions):
         is_po_box = False
         for word in normalized_words:
-            if (word["text"] == "box" and 
-                word["x0"] > x1 and 
-                abs(word["top"] - y) < 10):
+            if (word.text == "box" and 
+                word.x0 > x1 and 
+                abs(word.top - y) < 10):
                 is_po_box = True
                 break
         if not is_po_box:
@@ -267,18 +267,18 @@ def extract_po_number(words, vendor_name):
 
             candidates = []
             for w in normalized_words:
-                vertical_distance = w["top"] - label_y
+                vertical_distance = w.top - label_y
                 if "nemo" in vendor_lower:
                     # Nemo: strict x0 alignment
                     if (
-                        abs(w["x0"] - label_x0) <= x0_delta
+                        abs(w.x0 - label_x0) <= x0_delta
                         and 5 < vertical_distance <= max_y_dist
                     ):
                         candidates.append(w)
                 elif "topo designs" in vendor_lower:
                     # Topo Designs: 5px buffer left, 80px right of label_x0
                     if (
-                        (label_x0 - 5 <= w["x0"] <= label_x0 + 80)
+                        (label_x0 - 5 <= w.x0 <= label_x0 + 80)
                         and 5 < vertical_distance <= max_y_dist
                     ):
                         candidates.append(w)
@@ -286,7 +286,7 @@ def extract_po_number(words, vendor_name):
             # Group by y (line)
             lines = {}
             for w in candidates:
-                line_y = round(w["top"])
+                line_y = round(w.top)
                 if line_y not in lines:
                     lines[line_y] = []
                 lines[line_y].append(w)
@@ -297,8 +297,8 @@ def extract_po_number(words, vendor_name):
             selected_lines = []
             for line_y in sorted_line_ys[:num_lines]:
                 # Sort words left-to-right
-                line_words = sorted(lines[line_y], key=lambda w: w["x0"])
-                selected_lines.append(" ".join(w["orig"] for w in line_words))
+                line_words = sorted(lines[line_y], key=lambda w: w.x0)
+                selected_lines.append(" ".join(w.orig for w in line_words))
             if selected_lines:
                 po_number = " ".join(selected_lines).strip()
                 return po_number
@@ -743,7 +743,7 @@ def _extract_column_sum(words, vendor_name, preferred_label=None):
     return None
 
 
-def extract_quantity(words, vendor_name):
+def extract_quantity(words, vendor_name, discount_terms=None):
     """
     Main quantity extraction function.
     Uses approach map for known vendors, falls back to column_sum for unknown vendors.
@@ -753,6 +753,8 @@ def extract_quantity(words, vendor_name):
             - 'approach_used': The approach that successfully extracted the value
             - 'is_fallback': Boolean indicating if a fallback approach was used
             - 'configured_approaches': List of approaches that were configured
+
+    discount_terms may be passed in by extract_fields, which extracts them once per document.
     """
     logger.debug(f"Extracting quantity for vendor: {vendor_name}")
 
@@ -820,7 +822,8 @@ def extract_quantity(words, vendor_name):
         return '', metadata
 
     # Apply credit memo logic (negate for credit documents)
-    discount_terms = extract_discount_terms(words, vendor_name)
+    if discount_terms is None:
+        discount_terms = extract_discount_terms(words, vendor_name)
     is_credit = discount_terms and any(term in discount_terms.upper()
                                        for term in ['CREDIT MEMO', 'CREDIT NOTE'])
 
@@ -1,18 +1,20 @@
 import re
 from .common_extraction import normalize_words
 
-def extract_shipping_cost(words, vendor_name):
+def extract_shipping_cost(words, vendor_name, discount_terms=None):
     """
     Simplified shipping cost extraction using exact Y-coordinate matching.
     No zone filtering, no percentage thresholds, no total amount dependency.
+    discount_terms may be passed in by extract_fields, which extracts them once per document.
     """
     if not words:
         return ""
 
     # Credit memos and credit notes never have shipping costs (they're refunds/adjustments)
     # Use the discount terms extractor to properly identify document type
-    from extractors.discount_terms import extract_discount_terms
-    discount_terms = extract_discount_terms(words, vendor_name)
+    if discount_terms is None:
+        from extractors.discount_terms import extract_discount_terms
+        discount_terms = extract_discount_terms(words, vendor_name)
     if discount_terms and discount_terms.upper() in ['CREDIT MEMO', 'CREDIT NOTE']:
         return "0.00"
     
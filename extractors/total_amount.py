@@ -3,6 +3,7 @@ import string
 import csv
 import os
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, TypedDict
 from .common_extraction import normalize_words, find_label_positions, find_value_to_right
 from .utils import clean_currency
 from logging_config import get_logger
@@ -107,8 +108,17 @@ def _apply_credit_memo_logic(amount_str, words, vendor_name):
 
     return amount_str
 
+class TotalAmountResult(TypedDict):
+    """Shape of every extract_total_amount() result."""
+    total_amount: str
+    calculation_method: str
+    discount_type: str
+    discount_value: Optional[str]
+    pre_discount_amount: Optional[str]
+    has_calculation: bool
+
 def _create_result(total_amount, calculation_method='gross', discount_type='none',
-                  discount_value=None, pre_discount_amount=None):
+                  discount_value=None, pre_discount_amount=None) -> TotalAmountResult:
     """Create enhanced result dict with calculation details."""
     if not total_amount:
         return {
@@ -134,11 +144,10 @@ def _extract_percentage_from_terms(discount_terms):
     if not discount_terms or '%' not in discount_terms:
         return None
 
-    import re
     discount_match = re.search(r'(\d+(?:\.\d+)?)%', discount_terms)
     return discount_match.group(1) if discount_match else None
 
-def extract_total_amount(words, vendor_name):
+def extract_total_amount(words, vendor_name) -> TotalAmountResult:
     """Extract the total amount from OCR words, returns enhanced calculation data."""
 
 
@@ -290,7 +299,8 @@ def extract_total_amount(words, vendor_name):
                 try:
                     amount = float(cleaned)
                     #print(f"[DEBUG] Selected ON Running amount: {value} → {format_currency(amount)}")
-                    return _apply_credit_memo_logic(format_currency(amount), words, vendor_name)
+                    final_amount = _apply_credit_memo_logic(format_currency(amount), words, vendor_name)
+                    return _create_result(final_amount, 'label')
                 except Exception:
                     #print(f"[DEBUG] Failed to convert '{value}' to float for ON Running")
                     pass
@@ -343,7 +353,8 @@ def extract_total_amount(words, vendor_name):
                 amount = float(cleaned)
                 if vendor_name == "Simms":
                     logger.debug(f"Simms selected special-case amount: '{value}' → ${format_currency(amount)}")
-                return _apply_credit_memo_logic(format_currency(amount), words, vendor_name)
+                final_amount = _apply_credit_memo_logic(format_currency(amount), words, vendor_name)
+                return _create_result(final_amount, 'label')
             except Exception:
                 if vendor_name == "Simms":
                     logger.debug(f"Simms failed to convert '{value}' to float")
@@ -406,8 +417,7 @@ def extract_total_amount(words, vendor_name):
 
 def get_total_amount_string(words, vendor_name):
     """Backward compatibility function that returns just the total amount string."""
-    result = extract_total_amount(words, vendor_name)
-    return result.get('total_amount', '') if isinstance(result, dict) else str(result)
+    return extract_total_amount(words, vendor_name)['total_amount']
 
 def extract_bottom_most_currency(words, vendor_name):
     """Extract the currency amount that appears lowest on the page (highest Y-coordinate).
@@ -859,7 +869,6 @@ def _apply_calculated_adjustment(gross_amount, words, vendor_name):
         # Parse discount percentage if present
         discount_rate = Decimal('0.0')
         if discount_terms and '%' in discount_terms:
-            import re
             discount_match = re.search(r'(\d+(?:\.\d+)?)%', discount_terms)
             if discount_match:
                 discount_rate = Decimal(discount_match.group(1)) / Decimal('100.0')
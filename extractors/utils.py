@@ -1,5 +1,6 @@
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import csv
 import os
 
@@ -8,6 +9,16 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns used on the interactive recalculation path (run on every terms edit)
+_DIGITS_RE = re.compile(r"\d+")
+_PERCENT_RE = re.compile(r"(\d+)%")
+
+# Numeric dates (MM/DD/YY[YY] and YYYY-MM-DD) are the common case in
+# try_parse_date, so they are converted directly instead of failing through
+# the strptime formats one exception at a time
+_MDY_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}|[0-9]{2})")
+_YMD_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
 
 # --- Clean currency strings like "$1,234.56" to "1234.56" ---
 def clean_currency(value):
@@ -32,7 +43,7 @@ def calculate_discount_due_date(terms, invoice_date, vendor_name=None):
 
     # Collect candidate day values ignoring numbers tied to percentages.
     candidates = []
-    for m in re.finditer(r"\d+", terms_upper):
+    for m in _DIGITS_RE.finditer(terms_upper):
         idx = m.end()
         # Skip any whitespace after the number
         while idx < len(terms_upper) and terms_upper[idx].isspace():
@@ -79,7 +90,7 @@ def calculate_discounted_total(terms, total_amount, vendor_name):
         str: Formatted discounted total or None if no discount percentage found
     """
     # Check for discount percentage
-    discount_match = re.search(r"(\d+)%", terms)
+    discount_match = _PERCENT_RE.search(terms)
     
     discount_percent = float(discount_match.group(1)) / 100
     return discount_total(discount_percent, total_amount)
@@ -91,11 +102,33 @@ def discount_total(discount_percent, total_amount):
 
 
 # --- Try parsing a raw date string with multiple common formats ---
+@lru_cache(maxsize=2048)
 def try_parse_date(raw):
     """
     Attempts to parse a wide range of date formats into a datetime.date object.
+    Results are cached: the same date strings recur within and across invoices.
     """
     raw = raw.replace(",", "")
+
+    # Fast path for numeric dates. No other format below can match a string
+    # of this shape, so an impossible date is simply unparseable.
+    m = _MDY_RE.fullmatch(raw)
+    if m:
+        month, day, year = m.groups()
+        if len(year) == 2:
+            # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+            year = int(year) + (1900 if int(year) >= 69 else 2000)
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            return None
+    m = _YMD_RE.fullmatch(raw)
+    if m:
+        try:
+            return date(*map(int, m.groups()))
+        except ValueError:
+            return None
+
     for fmt in (
         "%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d",
         "%B %d %Y", "%b %d %Y", "%d %B %Y", "%d %b %Y",
@@ -1,6 +1,7 @@
 import re
 import os
 import csv
+from .common_extraction import joined_text
 from .utils import (
     get_vendor_list,
     normalize_vendor_name,
@@ -27,7 +28,7 @@ def reload_vendor_cache():
 
 def extract_vendor_name(words):
     all_words = [w["text"] for w in words]
-    normalized_blob = normalize_string(" ".join(all_words))
+    normalized_blob = normalize_string(joined_text(words))
     
     logger.debug(f"Normalized text blob ({len(normalized_blob)} chars): '{normalized_blob[:200]}{'...' if len(normalized_blob) > 200 else ''}'")
     logger.debug(f"Checking {len(MANUAL_MAP)} manual identifiers for matches...")
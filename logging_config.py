@@ -19,9 +19,21 @@ Usage:
 """
 
 import logging
+import multiprocessing
 import os
+import queue
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# State for start_async_logging()/stop_async_logging()
+_async_lock = threading.Lock()
+_async_depth = 0
+_async_listener = None
+
+# State for get_worker_log_queue()
+_worker_log_queue = None
+_worker_listener = None
 
 
 def setup_logging(level=logging.INFO, console_output=True, file_output=True, debug_mode=False):
@@ -136,16 +148,108 @@ def set_quiet_mode():
     logger.warning("Quiet mode enabled - only warnings and errors will show")
 
 
+def _output_handlers():
+    """Handlers that actually write output, whether or not they sit behind the async queue."""
+    listener = _async_listener
+    if listener is not None:
+        return listener.handlers
+    return logging.getLogger().handlers
+
+
+def start_async_logging():
+    """Hand log output to a background thread during intensive operations.
+
+    The root logger's handlers are moved behind a queue, so logging calls on
+    the extraction thread only enqueue the record and never wait on console
+    or file I/O. A no-op when the root handlers are already queue handlers.
+    Calls may nest; each must be paired with stop_async_logging().
+    """
+    global _async_depth, _async_listener
+
+    with _async_lock:
+        _async_depth += 1
+        if _async_depth > 1:
+            return
+
+        root_logger = logging.getLogger()
+        handlers = list(root_logger.handlers)
+        # Nothing to do when logging calls already only enqueue (e.g. in a
+        # worker process set up by init_worker_logging)
+        if all(isinstance(handler, QueueHandler) for handler in handlers):
+            return
+
+        log_queue = queue.SimpleQueue()
+        _async_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(QueueHandler(log_queue))
+        _async_listener.start()
+
+
+def stop_async_logging():
+    """Flush queued log records and put the original handlers back on the root logger."""
+    global _async_depth, _async_listener
+
+    with _async_lock:
+        if _async_depth == 0:
+            return
+        _async_depth -= 1
+        if _async_depth or _async_listener is None:
+            return
+
+        # stop() drains everything already queued before returning
+        _async_listener.stop()
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, QueueHandler):
+                root_logger.removeHandler(handler)
+        for handler in _async_listener.handlers:
+            root_logger.addHandler(handler)
+        _async_listener = None
+
+
+def worker_process_context():
+    """Start method for worker processes.
+
+    Workers are always spawned: forking the threaded Qt process is unsafe, and
+    forked children would share the parent's rotating file handlers.
+    """
+    return multiprocessing.get_context("spawn")
+
+
+def get_worker_log_queue():
+    """Queue that worker processes log into; pass it to init_worker_logging().
+
+    Created on first use along with a listener thread that writes its records
+    through this process's handlers. Both live for the rest of the process, so
+    workers still running after a canceled import always have somewhere to log.
+    """
+    global _worker_log_queue, _worker_listener
+
+    with _async_lock:
+        if _worker_log_queue is None:
+            _worker_log_queue = worker_process_context().Queue()
+            _worker_listener = QueueListener(_worker_log_queue, *_output_handlers(), respect_handler_level=True)
+            _worker_listener.start()
+        return _worker_log_queue
+
+
+def init_worker_logging(log_queue, level):
+    """Process pool initializer: send every log record to the parent through log_queue."""
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+
 def set_performance_mode():
     """Reduce logging during intensive operations for better performance.
 
     This temporarily reduces console output to WARNING level while keeping
     full file logging for later review.
     """
-    root_logger = logging.getLogger()
-
     # Keep file logging at full level, but reduce console output
-    for handler in root_logger.handlers:
+    for handler in _output_handlers():
         if isinstance(handler, logging.StreamHandler) and not isinstance(handler, (RotatingFileHandler,)):
             handler.setLevel(logging.WARNING)
 
@@ -155,10 +259,8 @@ def set_performance_mode():
 
 def restore_normal_mode():
     """Restore normal logging levels after performance mode."""
-    root_logger = logging.getLogger()
-
     # Restore console output to INFO level
-    for handler in root_logger.handlers:
+    for handler in _output_handlers():
         if isinstance(handler, logging.StreamHandler) and not isinstance(handler, (RotatingFileHandler,)):
             handler.setLevel(logging.INFO)
 
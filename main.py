@@ -1,6 +1,7 @@
 """Entry point for the AP Automation application."""
 import sys
 import logging
+import multiprocessing
 import traceback
 
 from PyQt5.QtCore import Qt, QCoreApplication
@@ -141,4 +142,6 @@ def main():
         sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # Required for the PDF worker processes in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -50,9 +50,9 @@ class Invoice:
     @classmethod
     def from_extracted_data(cls, data, file_path):
         """Create an Invoice from extracted data and file path."""
-        # Ensure data has at least 8 elements
-        while len(data) < 8:
-            data.append("")
+        # Ensure data has at least 8 elements (without mutating the caller's row)
+        if len(data) < 8:
+            data = list(data) + [""] * (8 - len(data))
             
         return cls(
             vendor_name=data[0],
@@ -361,12 +361,24 @@ class InvoiceTableModel(QAbstractTableModel):
         ]
         return values
 
+    def all_row_values(self) -> List[Tuple[str, ...]]:
+        """Return the 8 main values of every row in one pass - used for bulk export."""
+        return [
+            (str(r.vendor or ""), str(r.invoice or ""), str(r.po or ""),
+             str(r.inv_date or ""), str(r.terms or ""), str(r.due or ""),
+             str(r.total or ""), str(r.shipping or ""))
+            for r in self._rows
+        ]
+
     def get_file_path(self, src_row: int) -> str:
         return self._rows[src_row].file_path
 
     def set_file_path(self, src_row: int, path: str):
         self._rows[src_row].file_path = path or ""
 
+    def is_cell_edited(self, src_row: int, col: int) -> bool:
+        return col in self._rows[src_row].edited_cells
+
     # --- flag state (now shown in Actions column) ---
     def get_flag(self, src_row: int) -> bool:
         return self._rows[src_row].flag
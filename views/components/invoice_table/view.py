@@ -452,6 +452,11 @@ class InvoiceTable(QWidget):
             return [""] * 16
         return self._model.row_values_for_session(src)
     
+    def is_cell_edited(self, view_row: int, col: int) -> bool:
+        """Whether the user has edited this cell by hand (tracked on the source row)."""
+        src = self._view_to_source_row(view_row)
+        return src >= 0 and self._model.is_cell_edited(src, col)
+
     def update_calculated_field(self, view_row: int, col: int, value: str, emit_change: bool = True):
         """Update a table cell without marking it as manually edited."""
         src = self._view_to_source_row(view_row)
@@ -813,20 +813,6 @@ class QuickCalculatorInline(QGroupBox):
             calculated_values = self._calculate_based_on_priority(values)
             self._update_displays(calculated_values)
             
-    def _recalculate(self):
-        """Recalculate values based on priority queue logic."""
-        # Get current values
-        values = self._get_current_values()
-        
-        # Apply priority-based calculation logic
-        calculated_values = self._calculate_based_on_priority(values)
-        
-        # Update displays
-        self._update_displays(calculated_values)
-        
-        # Emit signal for external listeners
-        self.calculation_changed.emit(calculated_values)
-        
     def _get_current_values(self):
         """Get current field values as floats."""
         # Always use absolute value for discount (subtract positive amount)
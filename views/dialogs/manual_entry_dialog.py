@@ -68,7 +68,7 @@ QDateEdit { padding-right: 0 !important; }
 from views.components.pdf_viewer import InteractivePDFViewer
 from views.dialogs.vendor_list_dialog import VendorListDialog
 from extractors.utils import get_vendor_list, calculate_discount_due_date
-from assets.constants import COLORS
+from assets.constants import qcolor
 from views.helpers.style_loader import load_stylesheet, get_style_path
 
 
@@ -1341,7 +1341,7 @@ class ManualEntryDialog(QDialog):
 
         # Set background color for flagged items
         if flagged:
-            item.setBackground(QColor(COLORS['LIGHT_RED']))
+            item.setBackground(qcolor('LIGHT_RED'))
         else:
             item.setBackground(QBrush())
 
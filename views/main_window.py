@@ -252,6 +252,7 @@ class InvoiceApp(QWidget):
     # ---------------- Events/handlers ----------------
     def handle_row_deleted(self, row, file_path):
         self.file_controller.remove_file(file_path)
+        self.invoice_controller.forget_file(file_path)
         self.update_invoice_count()
         self.save_session()
 
@@ -295,6 +296,7 @@ class InvoiceApp(QWidget):
             self.table.setRowCount(0) if hasattr(self.table, "setRowCount") else None
             self.table.clear_tracking_data() if hasattr(self.table, "clear_tracking_data") else None
             self.file_controller.clear_all_files()
+            self.invoice_controller.clear_calculations()
             self.update_invoice_count()
             self.remove_session_file()
 
@@ -312,6 +314,7 @@ class InvoiceApp(QWidget):
                 # use helper to delete by file path to keep controllers in sync
                 self.table.delete_row_by_file_path(file_path, confirm=False)
                 self.file_controller.remove_file(file_path)
+                self.invoice_controller.forget_file(file_path)
             self.update_invoice_count()
             self.save_session()
 
@@ -524,11 +527,8 @@ class InvoiceApp(QWidget):
                         model.set_file_path(src_row, final_src_path)
                     else:
                         self.table.set_file_path_for_row(src_row, final_src_path)
-                    old_norm = os.path.normpath(file_path)
-                    new_norm = os.path.normpath(final_src_path)
-                    if old_norm in self.file_controller.loaded_files:
-                        self.file_controller.loaded_files.remove(old_norm)
-                        self.file_controller.loaded_files.add(new_norm)
+                    self.file_controller.rename_file(file_path, final_src_path)
+                    self.invoice_controller.rename_file(file_path, final_src_path)
 
                 exported_count += 1
 
@@ -736,11 +736,8 @@ class InvoiceApp(QWidget):
                         self.table.set_file_path_for_row(src_row, final_src_path)
                     
                     # Update file controller tracking
-                    old_norm = os.path.normpath(file_path)
-                    new_norm = os.path.normpath(final_src_path)
-                    if old_norm in self.file_controller.loaded_files:
-                        self.file_controller.loaded_files.remove(old_norm)
-                        self.file_controller.loaded_files.add(new_norm)
+                    self.file_controller.rename_file(file_path, final_src_path)
+                    self.invoice_controller.rename_file(file_path, final_src_path)
                         
                 files_exported += 1
                 
@@ -909,6 +906,7 @@ class InvoiceApp(QWidget):
                 self.table.toggle_row_flag(self.table.rowCount() - 1)
 
         self.file_controller.load_saved_files(data.get("loaded_files", []))
+        self.invoice_controller.clear_calculations()
         self.update_invoice_count()
         self._loading_session = False
 